@@ -0,0 +1,73 @@
+"""
+Compare the list-scan dedup of finnhub entries with the hashed one.
+
+Builds a synthetic insider-transaction payload with repeated entries and formats
+it with the original `entry not in seen` list scan and with
+_format_finnhub_entries(..., dedup=True), checking both produce the same report.
+
+Run from the repository root:
+
+    python -m benchmarks.finnhub_dedup [N_ENTRIES]
+"""
+
+import random
+import sys
+import time
+
+from tradingagents.dataflows.interface import _format_finnhub_entries
+
+
+def format_entry(day, entry):
+    return f"### Filing Date: {entry['filingDate']}, {entry['name']}:\nChange:{entry['change']}\nShares: {entry['share']}\nTransaction Price: {entry['transactionPrice']}\nTransaction Code: {entry['transactionCode']}\n\n"
+
+
+def build_payload(n_entries: int) -> dict:
+    """Synthetic {day: [entry, ...]} payload in which some entries repeat."""
+    rng = random.Random(0)
+    data = {}
+    for _ in range(n_entries):
+        day = f"2020-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        entry = {
+            "filingDate": day,
+            "name": f"N{rng.randint(0, 3000)}",
+            "change": rng.randint(-9, 9),
+            "share": rng.randint(0, 5),
+            "transactionPrice": 1.5,
+            "transactionCode": "S",
+        }
+        data.setdefault(day, []).append(entry)
+    return data
+
+
+def list_scan(data: dict) -> str:
+    """The original dedup: a linear `in` check against every entry seen so far."""
+    result_str = ""
+    seen_dicts = []
+    for day, entries in data.items():
+        for entry in entries:
+            if entry not in seen_dicts:
+                result_str += format_entry(day, entry)
+                seen_dicts.append(entry)
+    return result_str
+
+
+def main():
+    n_entries = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    data = build_payload(n_entries)
+
+    start = time.perf_counter()
+    expected = list_scan(data)
+    t_scan = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = _format_finnhub_entries(data, format_entry, dedup=True)
+    t_hashed = time.perf_counter() - start
+
+    assert result == expected
+    print(f"{n_entries} entries, {expected.count('### ')} unique")
+    print(f"list scan: {t_scan:.2f}s")
+    print(f"hashed:    {t_hashed:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
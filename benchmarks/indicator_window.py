@@ -0,0 +1,120 @@
+"""
+Compare the per-day indicator lookup with the windowed one.
+
+Builds a synthetic ten-year price CSV in a temporary directory and, for each
+indicator, looks up a 200-day window three ways:
+
+  * csv per day:    re-read and re-wrap the CSV for every day (the original path)
+  * store per day:  StockstatsUtils.get_stock_stats for every day
+  * window:         one StockstatsUtils.get_stock_stats_window call
+
+Run from the repository root:
+
+    python -m benchmarks.indicator_window
+"""
+
+import os
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from dateutil.relativedelta import relativedelta
+from stockstats import wrap
+
+from tradingagents.dataflows.config import get_config, set_config
+from tradingagents.dataflows.price_store import PRICE_FILE_TEMPLATE
+from tradingagents.dataflows.stockstats_utils import StockstatsUtils
+
+SYMBOL = "AAPL"
+INDICATORS = ["rsi", "macd", "close_50_sma", "boll_ub", "atr", "vwma", "mfi"]
+END_DATE = "2025-03-20"
+LOOK_BACK_DAYS = 200
+
+
+def write_price_csv(data_dir: str) -> set:
+    """Write a synthetic business-day price history and return its trading days."""
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range("2015-01-01", "2025-03-25")
+    close = 100 + np.cumsum(rng.standard_normal(len(dates)))
+    data = pd.DataFrame(
+        {
+            "Date": dates.strftime("%Y-%m-%d"),
+            "Open": close,
+            "High": close + 1,
+            "Low": close - 1,
+            "Close": close,
+            "Adj Close": close,
+            "Volume": rng.integers(100_000, 1_000_000, len(dates)),
+        }
+    )
+    data.to_csv(
+        os.path.join(data_dir, PRICE_FILE_TEMPLATE.format(symbol=SYMBOL)), index=False
+    )
+    return set(data["Date"])
+
+
+def csv_per_day(indicator: str, curr_date: str, data_dir: str):
+    """The original lookup: parse and wrap the whole CSV for a single day."""
+    df = wrap(
+        pd.read_csv(os.path.join(data_dir, PRICE_FILE_TEMPLATE.format(symbol=SYMBOL)))
+    )
+    df[indicator]
+    matching_rows = df[df["Date"].str.startswith(curr_date)]
+    return matching_rows[indicator].values[0]
+
+
+def trading_days(trading: set) -> list:
+    """Trading days in the window, newest first, as the indicator report walks them."""
+    curr_date = datetime.strptime(END_DATE, "%Y-%m-%d")
+    before = curr_date - relativedelta(days=LOOK_BACK_DAYS)
+    days = []
+    while curr_date >= before:
+        day = curr_date.strftime("%Y-%m-%d")
+        if day in trading:
+            days.append(day)
+        curr_date -= relativedelta(days=1)
+    return days
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    with tempfile.TemporaryDirectory() as data_dir:
+        set_config({**get_config(), "data_cache_dir": os.path.join(data_dir, "cache")})
+        days = trading_days(write_price_csv(data_dir))
+        start_date = min(days)
+
+        print(f"{len(days)} trading days per lookup")
+        print(f"{'indicator':<14}{'csv per day':>14}{'store per day':>16}{'window':>10}")
+        for indicator in INDICATORS:
+            csv_values, t_csv = timed(
+                lambda: [csv_per_day(indicator, day, data_dir) for day in days]
+            )
+            store_values, t_store = timed(
+                lambda: [
+                    StockstatsUtils.get_stock_stats(SYMBOL, indicator, day, data_dir)
+                    for day in days
+                ]
+            )
+            window, t_window = timed(
+                lambda: StockstatsUtils.get_stock_stats_window(
+                    SYMBOL, indicator, start_date, END_DATE, data_dir
+                )
+            )
+            window_values = [window[day] for day in days]
+
+            assert np.allclose(csv_values, store_values, equal_nan=True), indicator
+            assert np.allclose(csv_values, window_values, equal_nan=True), indicator
+            print(
+                f"{indicator:<14}{t_csv:>13.2f}s{t_store:>15.2f}s{t_window:>9.4f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
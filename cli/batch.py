@@ -0,0 +1,173 @@
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional, TextIO, Tuple
+
+from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+# Final state keys written as report files, in display order
+REPORT_SECTIONS = [
+    "market_report",
+    "sentiment_report",
+    "news_report",
+    "fundamentals_report",
+    "investment_plan",
+    "trader_investment_plan",
+    "final_trade_decision",
+]
+
+
+def load_runs(runs_file: Path) -> List[Tuple[str, str]]:
+    """Read (ticker, date) pairs from a batch file.
+
+    Supported formats:
+    - .jsonl: one {"ticker": ..., "date": ...} object per line
+    - .csv: columns "ticker" and "date" (a header row is required)
+    - anything else: one "TICKER YYYY-MM-DD" pair per line, "#" starts a comment
+
+    Raises ValueError naming the line of the first malformed entry.
+    """
+    runs_file = Path(runs_file)
+    runs = []
+    with open(runs_file, newline="") as f:
+        if runs_file.suffix == ".jsonl":
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    runs.append((record["ticker"], record["date"]))
+                except (ValueError, KeyError, TypeError):
+                    raise ValueError(
+                        f"{runs_file}:{line_no}: expected a JSON object with "
+                        f"\"ticker\" and \"date\", got {line.strip()!r}"
+                    )
+        elif runs_file.suffix == ".csv":
+            reader = csv.DictReader(f)
+            for row in reader:
+                ticker, date = row.get("ticker"), row.get("date")
+                if not ticker or not date:
+                    raise ValueError(
+                        f"{runs_file}:{reader.line_num}: expected \"ticker\" and "
+                        f"\"date\" columns, got {row!r}"
+                    )
+                runs.append((ticker.strip(), date.strip()))
+        else:
+            for line_no, line in enumerate(f, 1):
+                content = line.split("#", 1)[0].strip()
+                if not content:
+                    continue
+                fields = content.replace(",", " ").split()
+                if len(fields) != 2:
+                    raise ValueError(
+                        f"{runs_file}:{line_no}: expected \"TICKER YYYY-MM-DD\", "
+                        f"got {line.strip()!r}"
+                    )
+                runs.append((fields[0], fields[1]))
+
+    # Keep the first occurrence of duplicated pairs
+    return list(dict.fromkeys(runs))
+
+
+def emit(events: TextIO, event: str, **fields):
+    """Write one machine-readable progress event as a JSON line to events."""
+    record = {"event": event, "time": time.strftime("%Y-%m-%dT%H:%M:%S"), **fields}
+    events.write(json.dumps(record, ensure_ascii=False) + "\n")
+    events.flush()
+
+
+def write_run_outputs(results_dir: Path, ticker: str, trade_date: str, final_state, decision):
+    """Write the reports and the decision of one run under results_dir/ticker/date."""
+    run_dir = Path(results_dir) / ticker / trade_date
+    report_dir = run_dir / "reports"
+    report_dir.mkdir(parents=True, exist_ok=True)
+
+    for section in REPORT_SECTIONS:
+        content = final_state.get(section)
+        if content:
+            with open(report_dir / f"{section}.md", "w") as f:
+                f.write(content)
+
+    with open(run_dir / "decision.json", "w") as f:
+        json.dump(
+            {
+                "ticker": ticker,
+                "trade_date": trade_date,
+                "decision": decision,
+                "trader_investment_plan": final_state.get("trader_investment_plan"),
+                "final_trade_decision": final_state.get("final_trade_decision"),
+            },
+            f,
+            ensure_ascii=False,
+            indent=2,
+        )
+    return run_dir
+
+
+def run_batch(
+    graph: TradingAgentsGraph,
+    runs: List[Tuple[str, str]],
+    results_dir: Path,
+    concurrency: int = 4,
+    resume: bool = True,
+    events: Optional[TextIO] = None,
+) -> int:
+    """Run every pair through the graph and return the number of failed runs.
+
+    Progress events are written to events (stdout by default). Callers that
+    need the stream machine-readable should redirect the library's own print()
+    output elsewhere while this runs.
+    """
+    events = events or sys.stdout
+    started = time.monotonic()
+    completed = failed = 0
+    emit(events, "started", total=len(runs), concurrency=concurrency)
+
+    for result in graph.propagate_many(runs, max_concurrency=concurrency, resume=resume):
+        ticker, trade_date = result["ticker"], result["trade_date"]
+        if result["error"] is None:
+            try:
+                run_dir = write_run_outputs(
+                    results_dir,
+                    ticker,
+                    trade_date,
+                    result["final_state"],
+                    result["decision"],
+                )
+            except OSError as e:
+                result["error"] = e
+
+        if result["error"] is None:
+            completed += 1
+            emit(
+                events,
+                "completed",
+                ticker=ticker,
+                trade_date=trade_date,
+                decision=result["decision"],
+                output_dir=str(run_dir),
+                done=completed + failed,
+                total=len(runs),
+            )
+        else:
+            failed += 1
+            emit(
+                events,
+                "failed",
+                ticker=ticker,
+                trade_date=trade_date,
+                error=f"{type(result['error']).__name__}: {result['error']}",
+                done=completed + failed,
+                total=len(runs),
+            )
+
+    emit(
+        events,
+        "finished",
+        completed=completed,
+        failed=failed,
+        elapsed_seconds=round(time.monotonic() - started, 1),
+    )
+    return failed
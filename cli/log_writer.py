@@ -0,0 +1,85 @@
+import queue
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+
+class LogWriter:
+    """Write the message/tool log and the report files on a background thread.
+
+    Log lines and report sections are queued and written by a single thread
+    that keeps the log file open and flushes once per batch, so the render
+    loop never waits on disk. Report files are only rewritten when their
+    content changed, and only the latest content of a section in a batch is
+    written.
+    """
+
+    def __init__(self, log_file: Path, report_dir: Path, queue_size: int = 1024):
+        self.log_file = Path(log_file)
+        self.report_dir = Path(report_dir)
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=queue_size)
+        # Last content queued per report section, used for change detection
+        self._reports: Dict[str, str] = {}
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="cli-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def write_line(self, line: str):
+        """Queue one line for the message/tool log."""
+        self._queue.put(("line", line))
+
+    def write_report(self, section_name: str, content: str):
+        """Queue a report section, skipping it if the content did not change."""
+        if self._reports.get(section_name) == content:
+            return
+        self._reports[section_name] = content
+        self._queue.put(("report", section_name, content))
+
+    def _run(self):
+        with open(self.log_file, "a") as log:
+            while True:
+                batch = [self._queue.get()]
+                while True:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                try:
+                    self._write_batch(log, batch)
+                except OSError as e:
+                    print(f"Failed to write CLI logs: {e}")
+
+                for _ in batch:
+                    self._queue.task_done()
+                if None in batch:
+                    return
+
+    def _write_batch(self, log, batch):
+        reports = {}
+        for item in batch:
+            if item is None:
+                continue
+            if item[0] == "line":
+                log.write(item[1] + "\n")
+            else:
+                reports[item[1]] = item[2]
+        log.flush()
+
+        for section_name, content in reports.items():
+            with open(self.report_dir / f"{section_name}.md", "w") as f:
+                f.write(content)
+
+    def flush(self):
+        """Block until everything queued so far is on disk."""
+        self._queue.join()
+
+    def close(self):
+        """Write the remaining items and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
@@ -1,5 +1,7 @@
 from typing import Optional
+import contextlib
 import datetime
+import sys
 import typer
 from pathlib import Path
 from functools import wraps
@@ -19,10 +21,13 @@ from rich.tree import Tree
 from rich import box
 from rich.align import Align
 from rich.rule import Rule
+from langchain_core.messages import RemoveMessage
 
 from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.default_config import DEFAULT_CONFIG
 from cli.models import AnalystType
+from cli.log_writer import LogWriter
+from cli.batch import load_runs, run_batch
 from cli.utils import *
 
 console = Console()
@@ -36,11 +41,27 @@ app = typer.Typer(
 
 # Create a deque to store recent messages with a maximum length
 class MessageBuffer:
+    # Report sections in display order with their titles
+    SECTION_TITLES = {
+        "market_report": "Market Analysis",
+        "sentiment_report": "Social Sentiment",
+        "news_report": "News Analysis",
+        "fundamentals_report": "Fundamentals Analysis",
+        "investment_plan": "Research Team Decision",
+        "trader_investment_plan": "Trading Team Plan",
+        "final_trade_decision": "Portfolio Management Decision",
+    }
+    ANALYST_SECTIONS = [
+        "market_report",
+        "sentiment_report",
+        "news_report",
+        "fundamentals_report",
+    ]
+
     def __init__(self, max_length=100):
         self.messages = deque(maxlen=max_length)
         self.tool_calls = deque(maxlen=max_length)
         self.current_report = None
-        self.final_report = None  # Store the complete final report
         self.agent_status = {
             # Analyst Team
             "Market Analyst": "pending",
@@ -61,15 +82,25 @@ class MessageBuffer:
             "Portfolio Manager": "pending",
         }
         self.current_agent = None
-        self.report_sections = {
-            "market_report": None,
-            "sentiment_report": None,
-            "news_report": None,
-            "fundamentals_report": None,
-            "investment_plan": None,
-            "trader_investment_plan": None,
-            "final_trade_decision": None,
-        }
+        self.report_sections = {section: None for section in self.SECTION_TITLES}
+        self.reset_reports()
+
+    def reset_reports(self):
+        """Clear every report section together with its cached output."""
+        for section in self.report_sections:
+            self.report_sections[section] = None
+        self.current_report = None
+        self.current_section = None
+        # Sections changed since the complete report was last assembled
+        self._dirty_sections = set()
+        # Markdown part of each section in the complete report
+        self._report_parts = {}
+        self._final_report = None
+        # Parsed rich Markdown of the current report, built on first render
+        self._current_markdown = None
+        # LLM reply that is still being generated, shown until a report arrives
+        self.streaming_agent = None
+        self._streaming_parts = []
 
     def add_message(self, message_type, content):
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
@@ -86,85 +117,90 @@ class MessageBuffer:
 
     def update_report_section(self, section_name, content):
         if section_name in self.report_sections:
+            if self.report_sections[section_name] == content:
+                # Nothing changed, keep the cached report and Markdown
+                return
             self.report_sections[section_name] = content
-            self._update_current_report()
+            self._dirty_sections.add(section_name)
+            self.streaming_agent = None
+            self._update_current_report(section_name)
+
+    def append_stream(self, agent, text):
+        """Add a token of an LLM reply that is still being generated."""
+        if agent != self.streaming_agent:
+            self.streaming_agent = agent
+            self._streaming_parts = []
+        self._streaming_parts.append(text)
+        # The report text and its Markdown are only built when rendered
+        self._current_markdown = None
+
+    def end_stream(self):
+        """Drop the partial LLM reply once a node has finished and show the report again."""
+        if self.streaming_agent is None:
+            return
+        self.streaming_agent = None
+        self._streaming_parts = []
+        if self.current_section:
+            self._update_current_report(self.current_section)
+        else:
+            self.current_report = None
+            self._current_markdown = None
 
-    def _update_current_report(self):
+    def _update_current_report(self, section_name):
         # For the panel display, only show the most recently updated section
-        latest_section = None
-        latest_content = None
-
-        # Find the most recently updated section
-        for section, content in self.report_sections.items():
-            if content is not None:
-                latest_section = section
-                latest_content = content
-               
-        if latest_section and latest_content:
-            # Format the current section for display
-            section_titles = {
-                "market_report": "Market Analysis",
-                "sentiment_report": "Social Sentiment",
-                "news_report": "News Analysis",
-                "fundamentals_report": "Fundamentals Analysis",
-                "investment_plan": "Research Team Decision",
-                "trader_investment_plan": "Trading Team Plan",
-                "final_trade_decision": "Portfolio Management Decision",
-            }
-            self.current_report = (
-                f"### {section_titles[latest_section]}\n{latest_content}"
-            )
-
-        # Update the final complete report
-        self._update_final_report()
-
-    def _update_final_report(self):
-        report_parts = []
-
-        # Analyst Team Reports
-        if any(
-            self.report_sections[section]
-            for section in [
-                "market_report",
-                "sentiment_report",
-                "news_report",
-                "fundamentals_report",
-            ]
-        ):
-            report_parts.append("## Analyst Team Reports")
-            if self.report_sections["market_report"]:
-                report_parts.append(
-                    f"### Market Analysis\n{self.report_sections['market_report']}"
-                )
-            if self.report_sections["sentiment_report"]:
-                report_parts.append(
-                    f"### Social Sentiment\n{self.report_sections['sentiment_report']}"
-                )
-            if self.report_sections["news_report"]:
-                report_parts.append(
-                    f"### News Analysis\n{self.report_sections['news_report']}"
-                )
-            if self.report_sections["fundamentals_report"]:
-                report_parts.append(
-                    f"### Fundamentals Analysis\n{self.report_sections['fundamentals_report']}"
+        content = self.report_sections[section_name]
+        if content:
+            self.current_section = section_name
+            self.current_report = f"### {self.SECTION_TITLES[section_name]}\n{content}"
+            self._current_markdown = None
+        elif section_name == self.current_section:
+            self.current_section = None
+            self.current_report = None
+            self._current_markdown = None
+
+    def get_current_report_markdown(self):
+        """Rich Markdown of the current report, parsed once per change."""
+        if self._current_markdown is None:
+            if self.streaming_agent:
+                self._streaming_parts = ["".join(self._streaming_parts)]
+                self.current_report = (
+                    f"### {self.streaming_agent} (generating...)\n"
+                    f"{self._streaming_parts[0]}"
                 )
+            if self.current_report:
+                self._current_markdown = Markdown(self.current_report)
+        return self._current_markdown
+
+    @property
+    def final_report(self):
+        """The complete report, re-assembling only the sections that changed."""
+        if self._dirty_sections:
+            for section in self._dirty_sections:
+                content = self.report_sections[section]
+                if not content:
+                    self._report_parts.pop(section, None)
+                elif section in self.ANALYST_SECTIONS:
+                    self._report_parts[section] = (
+                        f"### {self.SECTION_TITLES[section]}\n{content}"
+                    )
+                else:
+                    self._report_parts[section] = (
+                        f"## {self.SECTION_TITLES[section]}\n\n{content}"
+                    )
+            self._dirty_sections.clear()
+
+            report_parts = []
+            # Analyst Team Reports
+            if any(section in self._report_parts for section in self.ANALYST_SECTIONS):
+                report_parts.append("## Analyst Team Reports")
+            report_parts.extend(
+                self._report_parts[section]
+                for section in self.SECTION_TITLES
+                if section in self._report_parts
+            )
+            self._final_report = "\n\n".join(report_parts) if report_parts else None
 
-        # Research Team Reports
-        if self.report_sections["investment_plan"]:
-            report_parts.append("## Research Team Decision")
-            report_parts.append(f"{self.report_sections['investment_plan']}")
-
-        # Trading Team Reports
-        if self.report_sections["trader_investment_plan"]:
-            report_parts.append("## Trading Team Plan")
-            report_parts.append(f"{self.report_sections['trader_investment_plan']}")
-
-        # Portfolio Management Decision
-        if self.report_sections["final_trade_decision"]:
-            report_parts.append("## Portfolio Management Decision")
-            report_parts.append(f"{self.report_sections['final_trade_decision']}")
-
-        self.final_report = "\n\n".join(report_parts) if report_parts else None
+        return self._final_report
 
 
 message_buffer = MessageBuffer()
@@ -354,10 +390,11 @@ def update_display(layout, spinner_text=None):
     )
 
     # Analysis panel showing current report
-    if message_buffer.current_report:
+    current_markdown = message_buffer.get_current_report_markdown()
+    if current_markdown is not None:
         layout["analysis"].update(
             Panel(
-                Markdown(message_buffer.current_report),
+                current_markdown,
                 title="Current Report",
                 border_style="green",
                 padding=(1, 2),
@@ -756,119 +793,129 @@ def run_analysis():
     report_dir.mkdir(parents=True, exist_ok=True)
     log_file = results_dir / "message_tool.log"
     log_file.touch(exist_ok=True)
+    # Logs and reports are written off the render loop by a background thread
+    log_writer = LogWriter(log_file, report_dir)
+
+    try:
+        def save_message_decorator(obj, func_name):
+            func = getattr(obj, func_name)
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                func(*args, **kwargs)
+                timestamp, message_type, content = obj.messages[-1]
+                content = content.replace("\n", " ")  # Replace newlines with spaces
+                log_writer.write_line(f"{timestamp} [{message_type}] {content}")
+            return wrapper
+
+        def save_tool_call_decorator(obj, func_name):
+            func = getattr(obj, func_name)
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                func(*args, **kwargs)
+                timestamp, tool_name, args = obj.tool_calls[-1]
+                args_str = ", ".join(f"{k}={v}" for k, v in args.items())
+                log_writer.write_line(f"{timestamp} [Tool Call] {tool_name}({args_str})")
+            return wrapper
+
+        def save_report_section_decorator(obj, func_name):
+            func = getattr(obj, func_name)
+            @wraps(func)
+            def wrapper(section_name, content):
+                func(section_name, content)
+                if section_name in obj.report_sections and obj.report_sections[section_name] is not None:
+                    content = obj.report_sections[section_name]
+                    if content:
+                        log_writer.write_report(section_name, content)
+            return wrapper
+
+        message_buffer.add_message = save_message_decorator(message_buffer, "add_message")
+        message_buffer.add_tool_call = save_tool_call_decorator(message_buffer, "add_tool_call")
+        message_buffer.update_report_section = save_report_section_decorator(message_buffer, "update_report_section")
+
+        # Now start the display layout
+        layout = create_layout()
+
+        with Live(layout, refresh_per_second=4) as live:
+            # Initial display
+            update_display(layout)
+
+            # Add initial messages
+            message_buffer.add_message("System", f"Selected ticker: {selections['ticker']}")
+            message_buffer.add_message(
+                "System", f"Analysis date: {selections['analysis_date']}"
+            )
+            message_buffer.add_message(
+                "System",
+                f"Selected analysts: {', '.join(analyst.value for analyst in selections['analysts'])}",
+            )
+            update_display(layout)
 
-    def save_message_decorator(obj, func_name):
-        func = getattr(obj, func_name)
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            func(*args, **kwargs)
-            timestamp, message_type, content = obj.messages[-1]
-            content = content.replace("\n", " ")  # Replace newlines with spaces
-            with open(log_file, "a") as f:
-                f.write(f"{timestamp} [{message_type}] {content}\n")
-        return wrapper
-    
-    def save_tool_call_decorator(obj, func_name):
-        func = getattr(obj, func_name)
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            func(*args, **kwargs)
-            timestamp, tool_name, args = obj.tool_calls[-1]
-            args_str = ", ".join(f"{k}={v}" for k, v in args.items())
-            with open(log_file, "a") as f:
-                f.write(f"{timestamp} [Tool Call] {tool_name}({args_str})\n")
-        return wrapper
-
-    def save_report_section_decorator(obj, func_name):
-        func = getattr(obj, func_name)
-        @wraps(func)
-        def wrapper(section_name, content):
-            func(section_name, content)
-            if section_name in obj.report_sections and obj.report_sections[section_name] is not None:
-                content = obj.report_sections[section_name]
-                if content:
-                    file_name = f"{section_name}.md"
-                    with open(report_dir / file_name, "w") as f:
-                        f.write(content)
-        return wrapper
-
-    message_buffer.add_message = save_message_decorator(message_buffer, "add_message")
-    message_buffer.add_tool_call = save_tool_call_decorator(message_buffer, "add_tool_call")
-    message_buffer.update_report_section = save_report_section_decorator(message_buffer, "update_report_section")
-
-    # Now start the display layout
-    layout = create_layout()
-
-    with Live(layout, refresh_per_second=4) as live:
-        # Initial display
-        update_display(layout)
-
-        # Add initial messages
-        message_buffer.add_message("System", f"Selected ticker: {selections['ticker']}")
-        message_buffer.add_message(
-            "System", f"Analysis date: {selections['analysis_date']}"
-        )
-        message_buffer.add_message(
-            "System",
-            f"Selected analysts: {', '.join(analyst.value for analyst in selections['analysts'])}",
-        )
-        update_display(layout)
-
-        # Reset agent statuses
-        for agent in message_buffer.agent_status:
-            message_buffer.update_agent_status(agent, "pending")
-
-        # Reset report sections
-        for section in message_buffer.report_sections:
-            message_buffer.report_sections[section] = None
-        message_buffer.current_report = None
-        message_buffer.final_report = None
-
-        # Update agent status to in_progress for the first analyst
-        first_analyst = f"{selections['analysts'][0].value.capitalize()} Analyst"
-        message_buffer.update_agent_status(first_analyst, "in_progress")
-        update_display(layout)
-
-        # Create spinner text
-        spinner_text = (
-            f"Analyzing {selections['ticker']} on {selections['analysis_date']}..."
-        )
-        update_display(layout, spinner_text)
+            # Reset agent statuses
+            for agent in message_buffer.agent_status:
+                message_buffer.update_agent_status(agent, "pending")
 
-        # Initialize state and get graph args
-        init_agent_state = graph.propagator.create_initial_state(
-            selections["ticker"], selections["analysis_date"]
-        )
-        args = graph.propagator.get_graph_args()
-
-        # Stream the analysis
-        trace = []
-        for chunk in graph.graph.stream(init_agent_state, **args):
-            if len(chunk["messages"]) > 0:
-                # Get the last message from the chunk
-                last_message = chunk["messages"][-1]
-
-                # Extract message content and type
-                if hasattr(last_message, "content"):
-                    content = extract_content_string(last_message.content)  # Use the helper function
-                    msg_type = "Reasoning"
-                else:
-                    content = str(last_message)
-                    msg_type = "System"
-
-                # Add message to buffer
-                message_buffer.add_message(msg_type, content)                
-
-                # If it's a tool call, add it to tool calls
-                if hasattr(last_message, "tool_calls"):
-                    for tool_call in last_message.tool_calls:
-                        # Handle both dictionary and object tool calls
-                        if isinstance(tool_call, dict):
-                            message_buffer.add_tool_call(
-                                tool_call["name"], tool_call["args"]
-                            )
-                        else:
-                            message_buffer.add_tool_call(tool_call.name, tool_call.args)
+            # Reset report sections
+            message_buffer.reset_reports()
+
+            # Update agent status to in_progress for the first analyst
+            first_analyst = f"{selections['analysts'][0].value.capitalize()} Analyst"
+            message_buffer.update_agent_status(first_analyst, "in_progress")
+            update_display(layout)
+
+            # Create spinner text
+            spinner_text = (
+                f"Analyzing {selections['ticker']} on {selections['analysis_date']}..."
+            )
+            update_display(layout, spinner_text)
+
+            # Stream node-level state updates and LLM tokens
+            final_state = None
+            last_token_refresh = 0.0
+            for kind, node, chunk in graph.stream_run(
+                selections["ticker"], selections["analysis_date"]
+            ):
+                if kind == "final":
+                    final_state = chunk
+                    break
+
+                if kind == "token":
+                    # Show partial output, redrawing no faster than the screen refreshes
+                    message_buffer.append_stream(node, extract_content_string(chunk))
+                    now = time.monotonic()
+                    if now - last_token_refresh >= 0.25:
+                        update_display(layout)
+                        last_token_refresh = now
+                    continue
+
+                # The node finished, so its reply is no longer being generated
+                message_buffer.end_stream()
+
+                # chunk holds only what the node changed
+                for last_message in chunk.get("messages", []):
+                    if isinstance(last_message, RemoveMessage):
+                        continue
+
+                    # Extract message content and type
+                    if hasattr(last_message, "content"):
+                        content = extract_content_string(last_message.content)  # Use the helper function
+                        msg_type = "Reasoning"
+                    else:
+                        content = str(last_message)
+                        msg_type = "System"
+
+                    # Add message to buffer
+                    message_buffer.add_message(msg_type, content)
+
+                    # If it's a tool call, add it to tool calls
+                    if hasattr(last_message, "tool_calls"):
+                        for tool_call in last_message.tool_calls:
+                            # Handle both dictionary and object tool calls
+                            if isinstance(tool_call, dict):
+                                message_buffer.add_tool_call(
+                                    tool_call["name"], tool_call["args"]
+                                )
+                            else:
+                                message_buffer.add_tool_call(tool_call.name, tool_call.args)
 
                 # Update reports and agent status based on chunk content
                 # Analyst Team Reports
@@ -1071,29 +1118,33 @@ def run_analysis():
                 # Update the display
                 update_display(layout)
 
-            trace.append(chunk)
-
-        # Get final state and decision
-        final_state = trace[-1]
-        decision = graph.process_signal(final_state["final_trade_decision"])
+            # Get final decision
+            decision = graph.process_signal(
+                final_state["final_trade_decision"],
+                final_state.get("trader_investment_plan"),
+            )
 
-        # Update all agent statuses to completed
-        for agent in message_buffer.agent_status:
-            message_buffer.update_agent_status(agent, "completed")
+            # Update all agent statuses to completed
+            for agent in message_buffer.agent_status:
+                message_buffer.update_agent_status(agent, "completed")
 
-        message_buffer.add_message(
-            "Analysis", f"Completed analysis for {selections['analysis_date']}"
-        )
+            message_buffer.add_message(
+                "Analysis", f"Completed analysis for {selections['analysis_date']}"
+            )
 
-        # Update final report sections
-        for section in message_buffer.report_sections.keys():
-            if section in final_state:
-                message_buffer.update_report_section(section, final_state[section])
+            # Update final report sections
+            for section in message_buffer.report_sections.keys():
+                if section in final_state:
+                    message_buffer.update_report_section(section, final_state[section])
 
-        # Display the complete final report
-        display_complete_report(final_state)
+            # Display the complete final report
+            display_complete_report(final_state)
 
-        update_display(layout)
+            update_display(layout)
+    finally:
+        # Write out queued log lines, reports and states even if the run failed
+        log_writer.close()
+        graph.close()
 
 
 @app.command()
@@ -1101,5 +1152,96 @@ def analyze():
     run_analysis()
 
 
+@app.command()
+def batch(
+    runs_file: Path = typer.Argument(
+        ...,
+        exists=True,
+        dir_okay=False,
+        help="File of ticker/date pairs (.csv with ticker,date columns, .jsonl, or 'TICKER DATE' lines)",
+    ),
+    analysts: str = typer.Option(
+        "market,social,news,fundamentals", help="Comma-separated analysts to run"
+    ),
+    research_depth: int = typer.Option(
+        1, help="Rounds of investment and risk debate"
+    ),
+    llm_provider: str = typer.Option(
+        DEFAULT_CONFIG["llm_provider"], help="openai, anthropic, google, ollama or openrouter"
+    ),
+    backend_url: str = typer.Option(DEFAULT_CONFIG["backend_url"]),
+    quick_think_llm: str = typer.Option(DEFAULT_CONFIG["quick_think_llm"]),
+    deep_think_llm: str = typer.Option(DEFAULT_CONFIG["deep_think_llm"]),
+    concurrency: int = typer.Option(4, min=1, help="Runs in flight at once"),
+    results_dir: Optional[Path] = typer.Option(
+        None, help="Output directory, defaults to the configured results_dir"
+    ),
+    parallel_analysts: bool = typer.Option(
+        False, help="Run the analysts of each run as concurrent branches"
+    ),
+    llm_cache: str = typer.Option(
+        DEFAULT_CONFIG["llm_cache_mode"], help="LLM response cache: passthrough, record or replay"
+    ),
+    resume: bool = typer.Option(
+        True, help="Skip finished pairs and continue interrupted ones from their checkpoint"
+    ),
+):
+    """Run many analyses without prompts or a dashboard, for scheduled jobs.
+
+    Progress is written to stdout as one JSON object per line, all other output
+    goes to stderr; reports and decisions go to RESULTS_DIR/TICKER/DATE. Exits
+    with status 1 if any run failed.
+    """
+    try:
+        runs = load_runs(runs_file)
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="RUNS_FILE")
+
+    selected_analysts = [
+        analyst.strip().lower() for analyst in analysts.split(",") if analyst.strip()
+    ]
+    valid_analysts = [analyst.value for analyst in AnalystType]
+    unknown = [analyst for analyst in selected_analysts if analyst not in valid_analysts]
+    if unknown or not selected_analysts:
+        raise typer.BadParameter(
+            f"expected a comma-separated subset of {', '.join(valid_analysts)}, "
+            f"got {analysts!r}",
+            param_hint="--analysts",
+        )
+
+    config = DEFAULT_CONFIG.copy()
+    config["max_debate_rounds"] = research_depth
+    config["max_risk_discuss_rounds"] = research_depth
+    config["llm_provider"] = llm_provider.lower()
+    config["backend_url"] = backend_url
+    config["quick_think_llm"] = quick_think_llm
+    config["deep_think_llm"] = deep_think_llm
+    config["parallel_analysts"] = parallel_analysts
+    config["llm_cache_mode"] = llm_cache
+    if results_dir is not None:
+        config["results_dir"] = str(results_dir)
+
+    # Keep stdout for the progress events: everything the library prints while
+    # the graph is built and the runs execute goes to stderr
+    events = sys.stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        graph = TradingAgentsGraph(
+            list(dict.fromkeys(selected_analysts)), config=config
+        )
+        try:
+            failed = run_batch(
+                graph,
+                runs,
+                Path(config["results_dir"]),
+                concurrency=concurrency,
+                resume=resume,
+                events=events,
+            )
+        finally:
+            graph.close()
+    if failed:
+        raise typer.Exit(code=1)
+
+
 if __name__ == "__main__":
     app()
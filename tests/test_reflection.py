@@ -0,0 +1,83 @@
+import re
+from types import SimpleNamespace
+
+from tradingagents.agents.utils.memory import AshareMemoryManager
+from tradingagents.graph.reflection import REFLECTION_COMPONENTS, Reflector
+
+
+class FakeLLM:
+    """Answers every reflection with a lesson naming the reflected report."""
+
+    def __init__(self):
+        self.batches = []
+
+    def batch(self, inputs, config=None):
+        self.batches.append(inputs)
+        return [
+            SimpleNamespace(
+                content="lesson for "
+                + re.search(r"Analysis/Decision: (.*)", messages[-1][1]).group(1)
+            )
+            for messages in inputs
+        ]
+
+
+def make_state(ticker):
+    return {
+        "market_report": f"{ticker} 放量突破",
+        "sentiment_report": f"{ticker} 情绪高涨",
+        "news_report": f"{ticker} 政策利好",
+        "fundamentals_report": f"{ticker} 营收增长",
+        "investment_plan": f"买入 {ticker}",
+        "trader_investment_plan": f"{ticker} trader plan",
+        "investment_debate_state": {
+            "bull_history": f"{ticker} bull case",
+            "bear_history": f"{ticker} bear case",
+            "judge_decision": f"{ticker} invest judge",
+        },
+        "risk_debate_state": {"judge_decision": f"{ticker} risk judge"},
+    }
+
+
+def make_memories(tmp_path):
+    config = {
+        "embedding_backend": "hashing",
+        "data_cache_dir": str(tmp_path),
+        "memory_persist_dir": str(tmp_path / "memory"),
+    }
+    return {
+        name: AshareMemoryManager(f"{name}_memory", config)
+        for name in REFLECTION_COMPONENTS
+    }
+
+
+def test_reflect_many_writes_every_component_memory(tmp_path):
+    llm = FakeLLM()
+    memories = make_memories(tmp_path)
+    items = [(make_state("600519"), 0.052), (make_state("000001"), -0.031)]
+
+    Reflector(llm).reflect_many(items, memories)
+
+    assert len(llm.batches) == 1
+    assert len(llm.batches[0]) == len(items) * len(memories)
+    for memory in memories.values():
+        assert memory.collection.count() == len(items)
+
+    matches = memories["bull"].get_similar_memories(make_state("600519"), n_matches=1)
+    assert matches[0]["case_study"] == {
+        "investment_plan": "买入 600519",
+        "trade_outcome": "0.052",
+        "key_lesson": "lesson for 600519 bull case",
+    }
+
+
+def test_reflect_all_is_idempotent(tmp_path):
+    memories = make_memories(tmp_path)
+    state = make_state("600519")
+    reflector = Reflector(FakeLLM())
+
+    reflector.reflect_all(state, 0.052, memories)
+    reflector.reflect_all(state, 0.052, memories)
+
+    for memory in memories.values():
+        assert memory.collection.count() == 1
@@ -12,14 +12,12 @@ import json
 #     get_ashare_top10_shareholders
 # )
 
-def create_fundamentals_analyst(llm, toolkit):
+def create_fundamentals_analyst(llm, toolkit, use_async=False):
     """
     创建一个为中国A股市场深度定制的基本面分析师智能体。
     """
-    def fundamentals_analyst_node(state):
-        """
-        这是在LangGraph中运行的实际节点。
-        """
+    def build_chain(state):
+        """构建本节点的提示词与LLM调用链。"""
         current_date = state["trade_date"]
         ticker = state["company_of_interest"] # 例如 '600519.SH'
 
@@ -58,9 +56,10 @@ def create_fundamentals_analyst(llm, toolkit):
         prompt = prompt.partial(ticker=ticker)
 
         chain = prompt | llm.bind_tools(tools)
+        return chain
 
-        result = chain.invoke(state["messages"])
-
+    def update_state(state, result) -> dict:
+        """根据LLM的回复生成状态更新。"""
         report = ""
         # 如果LLM没有调用工具而是直接生成了报告内容
         if not result.tool_calls and result.content:
@@ -76,4 +75,20 @@ def create_fundamentals_analyst(llm, toolkit):
             "fundamentals_report": report,
         }
 
-    return fundamentals_analyst_node
\ No newline at end of file
+    def fundamentals_analyst_node(state):
+        """
+        这是在LangGraph中运行的实际节点。
+        """
+        chain = build_chain(state)
+        result = chain.invoke(state["messages"])
+
+        return update_state(state, result)
+
+    async def afundamentals_analyst_node(state):
+        """fundamentals_analyst_node 的异步版本（ainvoke）。"""
+        chain = build_chain(state)
+        result = await chain.ainvoke(state["messages"])
+
+        return update_state(state, result)
+
+    return afundamentals_analyst_node if use_async else fundamentals_analyst_node
\ No newline at end of file
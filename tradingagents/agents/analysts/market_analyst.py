@@ -11,15 +11,13 @@ import json
 #     get_ashare_chanlun_analysis # 这是一个新的、专门用于缠论分析的工具
 # )
 
-def create_market_analyst(llm, toolkit):
+def create_market_analyst(llm, toolkit, use_async=False):
     """
     创建一个为中国A股市场深度定制的技术分析师智能体。
     该智能体融合了传统技术指标与A股市场独特的缠论结构分析。
     """
-    def market_analyst_node(state):
-        """
-        这是在LangGraph中运行的实际节点。
-        """
+    def build_chain(state):
+        """构建本节点的提示词与LLM调用链。"""
         current_date = state["trade_date"]
         ticker = state["company_of_interest"]
 
@@ -65,9 +63,10 @@ def create_market_analyst(llm, toolkit):
         prompt = prompt.partial(ticker=ticker)
 
         chain = prompt | llm.bind_tools(tools)
+        return chain
 
-        result = chain.invoke(state["messages"])
-
+    def update_state(state, result) -> dict:
+        """根据LLM的回复生成状态更新。"""
         report = ""
         if not result.tool_calls and result.content:
             report = result.content
@@ -79,4 +78,20 @@ def create_market_analyst(llm, toolkit):
             "market_report": report, # 在原版中是 market_report
         }
 
-    return market_analyst_node
\ No newline at end of file
+    def market_analyst_node(state):
+        """
+        这是在LangGraph中运行的实际节点。
+        """
+        chain = build_chain(state)
+        result = chain.invoke(state["messages"])
+
+        return update_state(state, result)
+
+    async def amarket_analyst_node(state):
+        """market_analyst_node 的异步版本（ainvoke）。"""
+        chain = build_chain(state)
+        result = await chain.ainvoke(state["messages"])
+
+        return update_state(state, result)
+
+    return amarket_analyst_node if use_async else market_analyst_node
\ No newline at end of file
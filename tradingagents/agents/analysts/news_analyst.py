@@ -10,14 +10,12 @@ import json
 #     get_ashare_sina_finance_news # 获取新浪财经等主流门户新闻
 # )
 
-def create_news_analyst(llm, toolkit):
+def create_news_analyst(llm, toolkit, use_async=False):
     """
     创建一个为中国A股市场深度定制的新闻与政策分析师智能体。
     """
-    def news_analyst_node(state):
-        """
-        这是在LangGraph中运行的实际节点。
-        """
+    def build_chain(state):
+        """构建本节点的提示词与LLM调用链。"""
         current_date = state["trade_date"]
         ticker = state["company_of_interest"]
 
@@ -57,8 +55,10 @@ def create_news_analyst(llm, toolkit):
         prompt = prompt.partial(ticker=ticker)
 
         chain = prompt | llm.bind_tools(tools)
-        result = chain.invoke(state["messages"])
+        return chain
 
+    def update_state(state, result) -> dict:
+        """根据LLM的回复生成状态更新。"""
         report = ""
         if not result.tool_calls and result.content:
             report = result.content
@@ -70,4 +70,20 @@ def create_news_analyst(llm, toolkit):
             "news_report": report,
         }
 
-    return news_analyst_node
\ No newline at end of file
+    def news_analyst_node(state):
+        """
+        这是在LangGraph中运行的实际节点。
+        """
+        chain = build_chain(state)
+        result = chain.invoke(state["messages"])
+
+        return update_state(state, result)
+
+    async def anews_analyst_node(state):
+        """news_analyst_node 的异步版本（ainvoke）。"""
+        chain = build_chain(state)
+        result = await chain.ainvoke(state["messages"])
+
+        return update_state(state, result)
+
+    return anews_analyst_node if use_async else news_analyst_node
\ No newline at end of file
@@ -12,14 +12,12 @@ import json
 #     get_douyin_video_transcripts # 获取抖音财经视频的文本内容和评论（高级功能）
 # )
 
-def create_social_media_analyst(llm, toolkit):
+def create_social_media_analyst(llm, toolkit, use_async=False):
     """
     创建一个为中国A股市场深度定制的、多源社交媒体与情绪分析师智能体。
     """
-    def social_media_analyst_node(state):
-        """
-        这是在LangGraph中运行的实际节点。
-        """
+    def build_chain(state):
+        """构建本节点的提示词与LLM调用链。"""
         current_date = state["trade_date"]
         ticker = state["company_of_interest"]
 
@@ -60,8 +58,10 @@ def create_social_media_analyst(llm, toolkit):
         prompt = prompt.partial(ticker=ticker)
 
         chain = prompt | llm.bind_tools(tools)
-        result = chain.invoke(state["messages"])
+        return chain
 
+    def update_state(state, result) -> dict:
+        """根据LLM的回复生成状态更新。"""
         report = ""
         if not result.tool_calls and result.content:
             report = result.content
@@ -73,4 +73,20 @@ def create_social_media_analyst(llm, toolkit):
             "sentiment_report": report,
         }
 
-    return social_media_analyst_node
\ No newline at end of file
+    def social_media_analyst_node(state):
+        """
+        这是在LangGraph中运行的实际节点。
+        """
+        chain = build_chain(state)
+        result = chain.invoke(state["messages"])
+
+        return update_state(state, result)
+
+    async def asocial_media_analyst_node(state):
+        """social_media_analyst_node 的异步版本（ainvoke）。"""
+        chain = build_chain(state)
+        result = await chain.ainvoke(state["messages"])
+
+        return update_state(state, result)
+
+    return asocial_media_analyst_node if use_async else social_media_analyst_node
\ No newline at end of file
@@ -1,16 +1,15 @@
 # tradingagents/agents/research_manager.py
 
+import asyncio
 import time
 import json
 
-def create_research_manager(llm, memory):
+def create_research_manager(llm, memory, use_async=False):
     """
     创建一个为中国A股市场深度定制的、扮演基金经理角色的决策智能体。
     """
-    def research_manager_node(state) -> dict:
-        """
-        这是在LangGraph中运行的最终决策节点。
-        """
+    def build_prompt(state) -> str:
+        """整理上下文并生成输入给LLM的完整提示词。"""
         # --- 收集所有分析师的最终报告 ---
         # 优化：使用.get()并提供默认值，增强代码的健壮性
         market_report = state.get("market_report", "无技术分析报告。")
@@ -55,8 +54,8 @@ def create_research_manager(llm, memory):
         )
 
         # 获取过去的投资反思
-        past_memories = memory.get_memories(all_reports, n_matches=2)
-        past_memory_str = "\n".join([f"- {rec['recommendation']}" for rec in past_memories]) if past_memories else "无相关的历史经验可供参考。"
+        past_memories = memory.get_similar_memories(state, n_matches=2)
+        past_memory_str = "\n".join([f"- 交易结果: {rec['case_study']['trade_outcome']}；经验教训: {rec['case_study']['key_lesson']}" for rec in past_memories]) if past_memories else "无相关的历史经验可供参考。"
 
         # 构建最终的提示
         final_prompt = (
@@ -68,9 +67,13 @@ def create_research_manager(llm, memory):
             f"--- 请根据以上所有信息，作为基金经理，给出你的最终决策和投资计划 ---"
         )
 
-        # 调用LLM进行最终决策
-        response = llm.invoke(final_prompt)
-        
+        return final_prompt
+
+    def update_state(state, response) -> dict:
+        """根据LLM的回复生成状态更新。"""
+        investment_debate_state = state.get("investment_debate_state", {})
+        history = investment_debate_state.get("history", "无辩论历史。")
+
         # 更新状态
         # 优化：简化状态更新逻辑，确保关键信息被传递
         new_investment_debate_state = {
@@ -85,4 +88,23 @@ def create_research_manager(llm, memory):
             "investment_plan": response.content,
         }
 
-    return research_manager_node
\ No newline at end of file
+    def research_manager_node(state) -> dict:
+        """
+        这是在LangGraph中运行的最终决策节点。
+        """
+        final_prompt = build_prompt(state)
+
+        # 调用LLM进行最终决策
+        response = llm.invoke(final_prompt)
+
+        return update_state(state, response)
+
+    async def aresearch_manager_node(state) -> dict:
+        """research_manager_node 的异步版本（ainvoke）。"""
+        # 历史记忆检索是阻塞调用（嵌入请求），放到线程中执行以免阻塞事件循环
+        final_prompt = await asyncio.to_thread(build_prompt, state)
+        response = await llm.ainvoke(final_prompt)
+
+        return update_state(state, response)
+
+    return aresearch_manager_node if use_async else research_manager_node
\ No newline at end of file
@@ -1,16 +1,15 @@
 # tradingagents/agents/risk_manager.py
 
+import asyncio
 import time
 import json
 
-def create_risk_manager(llm, memory):
+def create_risk_manager(llm, memory, use_async=False):
     """
     创建一个为中国A股市场深度定制的、扮演首席风险官（CRO）角色的智能体。
     """
-    def risk_manager_node(state) -> dict:
-        """
-        这是在LangGraph中运行的风险审查节点。
-        """
+    def build_prompt(state) -> str:
+        """整理上下文并生成输入给LLM的完整提示词。"""
         # --- 收集所有相关信息 ---
         # 优化：使用.get()并提供默认值，增强代码的健壮性
         market_report = state.get("market_report", "无技术分析报告。")
@@ -19,9 +18,6 @@ def create_risk_manager(llm, memory):
         # 修复原代码中的一个笔误，应为 fundamentals_report
         fundamentals_report = state.get("fundamentals_report", "无基本面分析报告。")
         trader_plan = state.get("investment_plan", "无投资计划。")
-        
-        risk_debate_state = state.get("risk_debate_state", {})
-        history = risk_debate_state.get("history", "无风险辩论历史。")
 
         # --- A股改造核心：重塑AI大脑 (系统提示词) ---
         # 这个提示词是整个系统的“安全阀”，定义了A股特色的风险审查清单。
@@ -55,8 +51,8 @@ def create_risk_manager(llm, memory):
             f"**社交媒体情绪报告:**\n{sentiment_report}"
         )
         
-        past_memories = memory.get_memories(all_reports, n_matches=2)
-        past_memory_str = "\n".join([f"- {rec['recommendation']}" for rec in past_memories]) if past_memories else "无相关的历史经验可供参考。"
+        past_memories = memory.get_similar_memories(state, n_matches=2)
+        past_memory_str = "\n".join([f"- 交易结果: {rec['case_study']['trade_outcome']}；经验教训: {rec['case_study']['key_lesson']}" for rec in past_memories]) if past_memories else "无相关的历史经验可供参考。"
 
         final_prompt = (
             f"{system_prompt}\n\n"
@@ -67,9 +63,13 @@ def create_risk_manager(llm, memory):
             f"--- 请根据以上所有信息，作为首席风险官，给出你的最终风险评估报告（必须为JSON格式） ---"
         )
 
-        # 调用LLM进行最终决策
-        response = llm.invoke(final_prompt)
-        
+        return final_prompt
+
+    def update_state(state, response) -> dict:
+        """根据LLM的回复生成状态更新。"""
+        risk_debate_state = state.get("risk_debate_state", {})
+        history = risk_debate_state.get("history", "无风险辩论历史。")
+
         # 更新状态
         new_risk_debate_state = {
             "judge_decision": response.content,
@@ -83,4 +83,23 @@ def create_risk_manager(llm, memory):
             "final_trade_decision": response.content,
         }
 
-    return risk_manager_node
\ No newline at end of file
+    def risk_manager_node(state) -> dict:
+        """
+        这是在LangGraph中运行的风险审查节点。
+        """
+        final_prompt = build_prompt(state)
+
+        # 调用LLM进行最终决策
+        response = llm.invoke(final_prompt)
+
+        return update_state(state, response)
+
+    async def arisk_manager_node(state) -> dict:
+        """risk_manager_node 的异步版本（ainvoke）。"""
+        # 历史记忆检索是阻塞调用（嵌入请求），放到线程中执行以免阻塞事件循环
+        final_prompt = await asyncio.to_thread(build_prompt, state)
+        response = await llm.ainvoke(final_prompt)
+
+        return update_state(state, response)
+
+    return arisk_manager_node if use_async else risk_manager_node
\ No newline at end of file
@@ -1,22 +1,20 @@
 # tradingagents/agents/bull_researcher.py
 
+import asyncio
 from langchain_core.messages import AIMessage
 import time
 import json
 
-def create_bull_researcher(llm, memory):
+def create_bull_researcher(llm, memory, use_async=False):
     """
     创建一个为中国A股市场深度定制的、扮演看多研究员角色的智能体。
     """
-    def bull_node(state) -> dict:
-        """
-        这是在LangGraph中运行的看多辩论节点。
-        """
+    def build_prompt(state) -> str:
+        """整理上下文并生成输入给LLM的完整提示词。"""
         # --- 收集所有相关信息 ---
         # 优化：使用.get()并提供默认值，增强代码的健壮性
         investment_debate_state = state.get("investment_debate_state", {})
         history = investment_debate_state.get("history", "无辩论历史。")
-        bull_history = investment_debate_state.get("bull_history", "")
         current_response = investment_debate_state.get("current_response", "看空方未提供观点。")
 
         market_report = state.get("market_report", "无技术分析报告。")
@@ -49,8 +47,8 @@ def create_bull_researcher(llm, memory):
             f"**社交媒体情绪报告:**\n{sentiment_report}"
         )
         
-        past_memories = memory.get_memories(all_reports, n_matches=2)
-        past_memory_str = "\n".join([f"- {rec['recommendation']}" for rec in past_memories]) if past_memories else "无相关的历史经验可供参考。"
+        past_memories = memory.get_similar_memories(state, n_matches=2)
+        past_memory_str = "\n".join([f"- 交易结果: {rec['case_study']['trade_outcome']}；经验教训: {rec['case_study']['key_lesson']}" for rec in past_memories]) if past_memories else "无相关的历史经验可供参考。"
 
         final_prompt = (
             f"{system_prompt}\n\n"
@@ -62,8 +60,13 @@ def create_bull_researcher(llm, memory):
             f"--- 请作为看多研究员，根据以上所有信息，给出你的反驳与看多论点 ---"
         )
 
-        # 调用LLM生成看多论点
-        response = llm.invoke(final_prompt)
+        return final_prompt
+
+    def update_state(state, response) -> dict:
+        """根据LLM的回复生成状态更新。"""
+        investment_debate_state = state.get("investment_debate_state", {})
+        history = investment_debate_state.get("history", "无辩论历史。")
+        bull_history = investment_debate_state.get("bull_history", "")
 
         # 格式化并更新状态
         argument = f"看多研究员: {response.content}"
@@ -77,4 +80,23 @@ def create_bull_researcher(llm, memory):
 
         return {"investment_debate_state": new_investment_debate_state}
 
-    return bull_node
\ No newline at end of file
+    def bull_node(state) -> dict:
+        """
+        这是在LangGraph中运行的看多辩论节点。
+        """
+        final_prompt = build_prompt(state)
+
+        # 调用LLM生成看多论点
+        response = llm.invoke(final_prompt)
+
+        return update_state(state, response)
+
+    async def abull_node(state) -> dict:
+        """bull_node 的异步版本（ainvoke）。"""
+        # 历史记忆检索是阻塞调用（嵌入请求），放到线程中执行以免阻塞事件循环
+        final_prompt = await asyncio.to_thread(build_prompt, state)
+        response = await llm.ainvoke(final_prompt)
+
+        return update_state(state, response)
+
+    return abull_node if use_async else bull_node
\ No newline at end of file
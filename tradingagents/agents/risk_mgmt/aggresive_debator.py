@@ -3,19 +3,16 @@
 import time
 import json
 
-def create_risky_debator(llm):
+def create_risky_debator(llm, use_async=False):
     """
     创建一个为中国A股市场深度定制的、扮演激进派风险分析师（“游资”风格）的智能体。
     """
-    def risky_node(state) -> dict:
-        """
-        这是在LangGraph中运行的激进风险辩论节点。
-        """
+    def build_prompt(state) -> str:
+        """整理上下文并生成输入给LLM的完整提示词。"""
         # --- 收集所有相关信息 ---
         # 优化：使用.get()并提供默认值，增强代码的健壮性
         risk_debate_state = state.get("risk_debate_state", {})
         history = risk_debate_state.get("history", "无风险辩论历史。")
-        risky_history = risk_debate_state.get("risky_history", "")
         current_safe_response = risk_debate_state.get("current_safe_response", "保守派未提供观点。")
         current_neutral_response = risk_debate_state.get("current_neutral_response", "中立派未提供观点。")
 
@@ -62,8 +59,13 @@ def create_risky_debator(llm):
             f"--- 请作为激进派风险分析师，根据以上所有信息，给出你的辩论观点 ---"
         )
 
-        # 调用LLM生成激进派论点
-        response = llm.invoke(final_prompt)
+        return final_prompt
+
+    def update_state(state, response) -> dict:
+        """根据LLM的回复生成状态更新。"""
+        risk_debate_state = state.get("risk_debate_state", {})
+        history = risk_debate_state.get("history", "无风险辩论历史。")
+        risky_history = risk_debate_state.get("risky_history", "")
 
         # 格式化并更新状态
         argument = f"激进派分析师: {response.content}"
@@ -81,4 +83,22 @@ def create_risky_debator(llm):
 
         return {"risk_debate_state": new_risk_debate_state}
 
-    return risky_node
\ No newline at end of file
+    def risky_node(state) -> dict:
+        """
+        这是在LangGraph中运行的激进风险辩论节点。
+        """
+        final_prompt = build_prompt(state)
+
+        # 调用LLM生成激进派论点
+        response = llm.invoke(final_prompt)
+
+        return update_state(state, response)
+
+    async def arisky_node(state) -> dict:
+        """risky_node 的异步版本（ainvoke）。"""
+        final_prompt = build_prompt(state)
+        response = await llm.ainvoke(final_prompt)
+
+        return update_state(state, response)
+
+    return arisky_node if use_async else risky_node
\ No newline at end of file
@@ -4,19 +4,16 @@ from langchain_core.messages import AIMessage
 import time
 import json
 
-def create_safe_debator(llm):
+def create_safe_debator(llm, use_async=False):
     """
     创建一个为中国A股市场深度定制的、扮演保守派风险分析师角色的智能体。
     """
-    def safe_node(state) -> dict:
-        """
-        这是在LangGraph中运行的保守风险辩论节点。
-        """
+    def build_prompt(state) -> str:
+        """整理上下文并生成输入给LLM的完整提示词。"""
         # --- 收集所有相关信息 ---
         # 优化：使用.get()并提供默认值，增强代码的健壮性
         risk_debate_state = state.get("risk_debate_state", {})
         history = risk_debate_state.get("history", "无风险辩论历史。")
-        safe_history = risk_debate_state.get("safe_history", "")
         current_risky_response = risk_debate_state.get("current_risky_response", "激进派未提供观点。")
         current_neutral_response = risk_debate_state.get("current_neutral_response", "中立派未提供观点。")
 
@@ -62,8 +59,13 @@ def create_safe_debator(llm):
             f"--- 请作为保守派风险分析师，根据以上所有信息，给出你的辩论观点 ---"
         )
 
-        # 调用LLM生成保守派论点
-        response = llm.invoke(final_prompt)
+        return final_prompt
+
+    def update_state(state, response) -> dict:
+        """根据LLM的回复生成状态更新。"""
+        risk_debate_state = state.get("risk_debate_state", {})
+        history = risk_debate_state.get("history", "无风险辩论历史。")
+        safe_history = risk_debate_state.get("safe_history", "")
 
         # 格式化并更新状态
         argument = f"保守派分析师: {response.content}"
@@ -81,4 +83,22 @@ def create_safe_debator(llm):
 
         return {"risk_debate_state": new_risk_debate_state}
 
-    return safe_node
\ No newline at end of file
+    def safe_node(state) -> dict:
+        """
+        这是在LangGraph中运行的保守风险辩论节点。
+        """
+        final_prompt = build_prompt(state)
+
+        # 调用LLM生成保守派论点
+        response = llm.invoke(final_prompt)
+
+        return update_state(state, response)
+
+    async def asafe_node(state) -> dict:
+        """safe_node 的异步版本（ainvoke）。"""
+        final_prompt = build_prompt(state)
+        response = await llm.ainvoke(final_prompt)
+
+        return update_state(state, response)
+
+    return asafe_node if use_async else safe_node
\ No newline at end of file
@@ -3,19 +3,16 @@
 import time
 import json
 
-def create_neutral_debator(llm):
+def create_neutral_debator(llm, use_async=False):
     """
     创建一个为中国A股市场深度定制的、扮演中立派策略分析师角色的智能体。
     """
-    def neutral_node(state) -> dict:
-        """
-        这是在LangGraph中运行的中立风险辩论节点。
-        """
+    def build_prompt(state) -> str:
+        """整理上下文并生成输入给LLM的完整提示词。"""
         # --- 收集所有相关信息 ---
         # 优化：使用.get()并提供默认值，增强代码的健壮性
         risk_debate_state = state.get("risk_debate_state", {})
         history = risk_debate_state.get("history", "无风险辩论历史。")
-        neutral_history = risk_debate_state.get("neutral_history", "")
         current_risky_response = risk_debate_state.get("current_risky_response", "激进派未提供观点。")
         current_safe_response = risk_debate_state.get("current_safe_response", "保守派未提供观点。")
 
@@ -64,8 +61,13 @@ def create_neutral_debator(llm):
             f"--- 请作为中立派策略分析师，根据以上所有信息，给出你的辩论观点和战术建议 ---"
         )
 
-        # 调用LLM生成中立派论点
-        response = llm.invoke(final_prompt)
+        return final_prompt
+
+    def update_state(state, response) -> dict:
+        """根据LLM的回复生成状态更新。"""
+        risk_debate_state = state.get("risk_debate_state", {})
+        history = risk_debate_state.get("history", "无风险辩论历史。")
+        neutral_history = risk_debate_state.get("neutral_history", "")
 
         # 格式化并更新状态
         argument = f"中立派分析师: {response.content}"
@@ -83,4 +85,22 @@ def create_neutral_debator(llm):
 
         return {"risk_debate_state": new_risk_debate_state}
 
-    return neutral_node
\ No newline at end of file
+    def neutral_node(state) -> dict:
+        """
+        这是在LangGraph中运行的中立风险辩论节点。
+        """
+        final_prompt = build_prompt(state)
+
+        # 调用LLM生成中立派论点
+        response = llm.invoke(final_prompt)
+
+        return update_state(state, response)
+
+    async def aneutral_node(state) -> dict:
+        """neutral_node 的异步版本（ainvoke）。"""
+        final_prompt = build_prompt(state)
+        response = await llm.ainvoke(final_prompt)
+
+        return update_state(state, response)
+
+    return aneutral_node if use_async else neutral_node
\ No newline at end of file
@@ -1,17 +1,16 @@
 # tradingagents/agents/trader.py
 
+import asyncio
 import functools
 import time
 import json
 
-def create_trader(llm, memory):
+def create_trader(llm, memory, use_async=False):
     """
     创建一个为中国A股市场深度定制的、扮演首席交易员角色的智能体。
     """
-    def trader_node(state, name):
-        """
-        这是在LangGraph中运行的交易员决策节点。
-        """
+    def build_prompt(state) -> str:
+        """整理上下文并生成输入给LLM的完整提示词。"""
         # --- 收集所有相关信息 ---
         # 优化：使用.get()并提供默认值，增强代码的健壮性
         company_name = state.get("company_of_interest", "未知公司")
@@ -61,8 +60,8 @@ def create_trader(llm, memory):
             f"**社交媒体情绪报告:**\n{sentiment_report}"
         )
         
-        past_memories = memory.get_memories(all_reports, n_matches=2)
-        past_memory_str = "\n".join([f"- {rec['recommendation']}" for rec in past_memories]) if past_memories else "无相关的历史经验可供参考。"
+        past_memories = memory.get_similar_memories(state, n_matches=2)
+        past_memory_str = "\n".join([f"- 交易结果: {rec['case_study']['trade_outcome']}；经验教训: {rec['case_study']['key_lesson']}" for rec in past_memories]) if past_memories else "无相关的历史经验可供参考。"
 
         final_prompt = (
             f"{system_prompt}\n\n"
@@ -74,13 +73,33 @@ def create_trader(llm, memory):
             f"--- 请作为首席交易员，根据以上所有信息，生成你的最终交易指令（必须为JSON格式） ---"
         )
 
-        # 调用LLM生成交易指令
-        result = llm.invoke(final_prompt)
+        return final_prompt
 
+    def update_state(state, result, name) -> dict:
+        """根据LLM的回复生成状态更新。"""
         return {
             "messages": [result],
             "trader_investment_plan": result.content, # 保持原有的键名，但内容已是结构化的JSON
             "sender": name,
         }
 
-    return functools.partial(trader_node, name="Trader")
\ No newline at end of file
+    def trader_node(state, name):
+        """
+        这是在LangGraph中运行的交易员决策节点。
+        """
+        final_prompt = build_prompt(state)
+
+        # 调用LLM生成交易指令
+        result = llm.invoke(final_prompt)
+
+        return update_state(state, result, name)
+
+    async def atrader_node(state, name):
+        """trader_node 的异步版本（ainvoke）。"""
+        # 历史记忆检索是阻塞调用（嵌入请求），放到线程中执行以免阻塞事件循环
+        final_prompt = await asyncio.to_thread(build_prompt, state)
+        result = await llm.ainvoke(final_prompt)
+
+        return update_state(state, result, name)
+
+    return functools.partial(atrader_node if use_async else trader_node, name="Trader")
\ No newline at end of file
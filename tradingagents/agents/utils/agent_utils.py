@@ -12,6 +12,7 @@ from datetime import datetime, timedelta
 from tradingagents.default_config import DEFAULT_CONFIG
 # 假设您已经创建了对接Tushare/Baostock的底层数据接口
 import tradingagents.dataflows.ashare_interface as ashare_interface 
+import tradingagents.dataflows.interface as interface
 # 假设您已经集成了缠论计算库
 import tradingagents.dataflows.chanlun_calculator as chanlun_calculator
 
@@ -146,4 +147,40 @@ class AshareToolkit:
         if not chanlun_result:
             return "缠论分析失败。"
         # 将复杂的分析结果格式化为对LLM友好的文本摘要
-        return json.dumps(chanlun_result, indent=2, ensure_ascii=False)
\ No newline at end of file
+        return json.dumps(chanlun_result, indent=2, ensure_ascii=False)
+
+    @staticmethod
+    @tool
+    def get_stockstats_indicators_batch_report(
+        symbol: Annotated[str, "股票代码"],
+        indicators: Annotated[
+            List[str], "需要计算的技术指标列表，例如 ['close_50_sma', 'macd', 'rsi', 'boll_ub', 'atr']"
+        ],
+        curr_date: Annotated[str, "当前交易日期，格式为 YYYY-mm-dd"],
+        look_back_days: Annotated[int, "回看的天数"] = 30,
+    ) -> str:
+        """
+        一次调用计算多个技术指标（离线行情数据），返回按交易日对齐的指标表。
+        用它代替对每个指标分别调用工具。
+        """
+        return interface.get_stock_stats_indicators_batch_window(
+            symbol, indicators, curr_date, look_back_days, False
+        )
+
+    @staticmethod
+    @tool
+    def get_stockstats_indicators_batch_report_online(
+        symbol: Annotated[str, "股票代码"],
+        indicators: Annotated[
+            List[str], "需要计算的技术指标列表，例如 ['close_50_sma', 'macd', 'rsi', 'boll_ub', 'atr']"
+        ],
+        curr_date: Annotated[str, "当前交易日期，格式为 YYYY-mm-dd"],
+        look_back_days: Annotated[int, "回看的天数"] = 30,
+    ) -> str:
+        """
+        一次调用计算多个技术指标（在线行情数据），返回按交易日对齐的指标表。
+        用它代替对每个指标分别调用工具。
+        """
+        return interface.get_stock_stats_indicators_batch_window(
+            symbol, indicators, curr_date, look_back_days, True
+        )
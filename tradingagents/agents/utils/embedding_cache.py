@@ -0,0 +1,117 @@
+# tradingagents/agents/utils/embedding_cache.py
+
+import hashlib
+import os
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class EmbeddingCache:
+    """
+    按内容哈希缓存嵌入向量，由所有记忆模块实例共享。
+    键为 (嵌入模型, 文本) 的 SHA-256 摘要；最近使用的向量保存在进程内LRU中，
+    所有向量同时写入SQLite文件，因此相同的情景文本在一次运行中只请求一次嵌入接口，
+    并且跨运行复用。
+    """
+
+    def __init__(self, db_path: str, max_memory_entries: int = 4096):
+        self.db_path = db_path
+        self.max_memory_entries = max_memory_entries
+        self._lru: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                vector BLOB NOT NULL
+            ) WITHOUT ROWID
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def content_key(model: str, text: str) -> str:
+        """计算 (模型, 文本) 的内容哈希键"""
+        return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).hexdigest()
+
+    def _remember(self, key: str, embedding: List[float]):
+        self._lru[key] = embedding
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_memory_entries:
+            self._lru.popitem(last=False)
+
+    def get_many(self, model: str, texts: List[str]) -> List[Optional[List[float]]]:
+        """批量查询嵌入向量，按 texts 顺序返回，未命中的位置为 None"""
+        keys = [self.content_key(model, text) for text in texts]
+        found: Dict[str, List[float]] = {}
+        with self._lock:
+            missing = []
+            for key in keys:
+                embedding = self._lru.get(key)
+                if embedding is not None:
+                    self._lru.move_to_end(key)
+                    found[key] = embedding
+                else:
+                    missing.append(key)
+
+            missing = list(dict.fromkeys(missing))
+            # SQLite 对单条语句的参数个数有限制，分块查询
+            for start in range(0, len(missing), 500):
+                chunk = missing[start : start + 500]
+                rows = self._conn.execute(
+                    "SELECT key, vector FROM embeddings WHERE key IN (%s)"
+                    % ",".join("?" * len(chunk)),
+                    chunk,
+                ).fetchall()
+                for key, vector in rows:
+                    embedding = array("d", vector).tolist()
+                    self._remember(key, embedding)
+                    found[key] = embedding
+        return [found.get(key) for key in keys]
+
+    def put_many(self, model: str, items: Iterable[Tuple[str, List[float]]]):
+        """批量写入 (文本, 嵌入向量)，只提交一次事务"""
+        rows = []
+        with self._lock:
+            for text, embedding in items:
+                key = self.content_key(model, text)
+                embedding = list(embedding)
+                self._remember(key, embedding)
+                rows.append((key, model, array("d", embedding).tobytes()))
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, model, vector) VALUES (?, ?, ?)",
+                    rows,
+                )
+
+    def clear(self):
+        """清空内存与磁盘上的全部缓存"""
+        with self._lock:
+            self._lru.clear()
+            with self._conn:
+                self._conn.execute("DELETE FROM embeddings")
+
+
+_embedding_caches: Dict[str, EmbeddingCache] = {}
+_embedding_caches_lock = threading.Lock()
+
+
+def get_embedding_cache(config: Dict) -> EmbeddingCache:
+    """获取进程内共享的嵌入缓存（同一缓存文件只创建一个实例）"""
+    db_path = os.path.join(config["data_cache_dir"], "embedding_cache.sqlite")
+    with _embedding_caches_lock:
+        cache = _embedding_caches.get(db_path)
+        if cache is None:
+            cache = EmbeddingCache(
+                db_path,
+                max_memory_entries=config.get("embedding_cache_max_entries", 4096),
+            )
+            _embedding_caches[db_path] = cache
+        return cache
@@ -0,0 +1,103 @@
+# tradingagents/agents/utils/embeddings.py
+
+import math
+import re
+import zlib
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Dict, List
+
+from openai import OpenAI
+
+
+class EmbeddingBackend(ABC):
+    """
+    嵌入后端接口：记忆模块只通过 embed() 获取向量，具体实现由配置选择。
+    model_name 用于区分不同后端/参数生成的向量（作为嵌入缓存的键，并写入记忆集合名）；
+    remote 表示是否需要网络请求，本地后端无需经过嵌入缓存。
+    """
+
+    model_name: str = ""
+    remote: bool = True
+
+    @abstractmethod
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        """按输入顺序返回一批文本的嵌入向量"""
+
+
+class OpenAIEmbeddingBackend(EmbeddingBackend):
+    """通过 OpenAI 兼容接口（OpenAI 或 Ollama）获取嵌入向量"""
+
+    remote = True
+
+    def __init__(self, model_name: str, base_url: str = None):
+        self.model_name = model_name
+        self.client = OpenAI(base_url=base_url)
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        response = self.client.embeddings.create(model=self.model_name, input=texts)
+        # 接口按输入顺序返回，但以 index 字段为准
+        return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+
+
+class HashingEmbeddingBackend(EmbeddingBackend):
+    """
+    纯CPU、离线可用的哈希TF嵌入：
+    中文按单字与相邻二字切分，英文/数字按词切分，经 CRC32 哈希到固定维度，
+    词频取对数平滑后做L2归一化。不依赖语料统计和模型文件，结果确定、线程安全。
+    """
+
+    remote = False
+
+    # 连续的中日韩字符，或英文单词/数字（含小数与百分号）
+    _token_pattern = re.compile(r"[\u4e00-\u9fff]+|[A-Za-z]+|\d+(?:\.\d+)?%?")
+
+    def __init__(self, dimensions: int = 1024):
+        self.dimensions = dimensions
+        self.model_name = f"hashing-tf-{dimensions}"
+
+    def _features(self, text: str) -> Counter:
+        features = Counter()
+        for token in self._token_pattern.findall(text.lower()):
+            if "\u4e00" <= token[0] <= "\u9fff":
+                features.update(token)
+                features.update(token[i : i + 2] for i in range(len(token) - 1))
+            else:
+                features[token] += 1
+        return features
+
+    def _embed_one(self, text: str) -> List[float]:
+        vector = [0.0] * self.dimensions
+        for feature, count in self._features(text).items():
+            h = zlib.crc32(feature.encode("utf-8"))
+            # 用哈希的最高位决定符号，减少哈希冲突带来的偏差
+            sign = 1.0 if h & 0x80000000 else -1.0
+            vector[h % self.dimensions] += sign * (1.0 + math.log(count))
+
+        norm = math.sqrt(sum(v * v for v in vector))
+        if norm > 0:
+            vector = [v / norm for v in vector]
+        return vector
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        return [self._embed_one(text) for text in texts]
+
+
+def create_embedding_backend(config: Dict) -> EmbeddingBackend:
+    """根据配置创建嵌入后端：embedding_backend 可选 "openai"（默认）或 "hashing"。"""
+    backend = config.get("embedding_backend", "openai")
+
+    if backend == "hashing":
+        return HashingEmbeddingBackend(config.get("embedding_dimensions", 1024))
+
+    if backend == "openai":
+        # 优化：优先选择针对中文优化的嵌入模型
+        # 如果使用本地模型（如Ollama），可以指定中文特化模型
+        if config.get("backend_url") and "localhost" in config["backend_url"]:
+            model_name = "nomic-embed-text"  # 示例，可替换为其他本地中文模型
+        else:
+            # OpenAI的text-embedding-3-small对多语言支持很好，是一个不错的选择
+            model_name = "text-embedding-3-small"
+        return OpenAIEmbeddingBackend(model_name, base_url=config.get("backend_url"))
+
+    raise ValueError(f"Unsupported embedding backend: {backend}")
@@ -2,37 +2,81 @@
 
 import chromadb
 from chromadb.config import Settings
-from openai import OpenAI
+import hashlib
 import json
+import os
+import re
 from typing import List, Dict, Tuple
 
+from .embedding_cache import get_embedding_cache
+from .embeddings import create_embedding_backend
+
 class AshareMemoryManager:
     """
     一个为中国A股市场深度定制的、结构化的长期记忆与交易复盘系统。
     它取代了原版简单的文本拼接，使用结构化的“市场快照”和“交易复盘档案”来提升记忆的质量和检索的精准度。
     """
     def __init__(self, name: str, config: Dict):
-        # 优化：优先选择针对中文优化的嵌入模型
-        # 如果使用本地模型（如Ollama），可以指定中文特化模型
-        if config.get("backend_url") and "localhost" in config["backend_url"]:
-            self.embedding_model = "nomic-embed-text" # 示例，可替换为其他本地中文模型
+        # 嵌入后端由配置选择：远程接口（OpenAI/Ollama）或本地CPU实现
+        self.embedding_backend = create_embedding_backend(config)
+        self.embedding_model = self.embedding_backend.model_name
+        # 所有记忆模块共享同一个按内容哈希索引的嵌入缓存（本地后端直接计算，无需缓存）
+        self.embedding_cache = (
+            get_embedding_cache(config)
+            if config.get("embedding_cache", True) and self.embedding_backend.remote
+            else None
+        )
+        # 每次请求嵌入接口时最多发送的文本条数
+        self.embedding_batch_size = config.get("embedding_batch_size", 64)
+        # 配置了 memory_persist_dir 时记忆持久化到磁盘，跨运行保留；否则只保存在内存中
+        persist_dir = config.get("memory_persist_dir")
+        if persist_dir:
+            os.makedirs(persist_dir, exist_ok=True)
+            self.chroma_client = chromadb.PersistentClient(
+                path=persist_dir, settings=Settings(allow_reset=True)
+            )
         else:
-            # OpenAI的text-embedding-3-small对多语言支持很好，是一个不错的选择
-            self.embedding_model = "text-embedding-3-small"
-            
-        self.client = OpenAI(base_url=config.get("backend_url"))
-        self.chroma_client = chromadb.Client(Settings(allow_reset=True))
-        self.collection = self.chroma_client.create_collection(name=name)
+            self.chroma_client = chromadb.Client(Settings(allow_reset=True))
+        # get-or-create：重复创建同名记忆模块（或重启后）直接复用已有集合；
+        # 集合名带上嵌入模型名，换用不同模型/维度的后端时不会查询到不兼容的向量
+        self.collection = self.chroma_client.get_or_create_collection(
+            name=self._collection_name(name, self.embedding_model)
+        )
         print(f"A股记忆模块 '{name}' 初始化成功，使用嵌入模型: {self.embedding_model}")
 
+    @staticmethod
+    def _collection_name(name: str, embedding_model: str) -> str:
+        """记忆模块名加嵌入模型名，替换掉 Chroma 集合名不允许的字符"""
+        return re.sub(r"[^a-zA-Z0-9_-]+", "-", f"{name}-{embedding_model}").strip("-_")
+
     def _get_embedding(self, text: str) -> List[float]:
-        """获取文本的嵌入向量"""
-        response = self.client.embeddings.create(
-            model=self.embedding_model, input=text
-        )
-        # 注意：根据OpenAI最新API版本，访问方式可能为 response.data.embedding
-        # 请根据您使用的openai库版本确认
-        return response.data.embedding
+        """获取文本的嵌入向量，相同内容优先从共享缓存读取"""
+        return self._get_embeddings([text])[0]
+
+    def _get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        批量获取嵌入向量：先查共享缓存，未命中的文本去重后
+        按 embedding_batch_size 分批请求嵌入接口，结果按 texts 顺序返回。
+        """
+        if self.embedding_cache is None:
+            cached = [None] * len(texts)
+        else:
+            cached = self.embedding_cache.get_many(self.embedding_model, texts)
+
+        missing = list(dict.fromkeys(t for t, e in zip(texts, cached) if e is None))
+        computed = {}
+        for start in range(0, len(missing), self.embedding_batch_size):
+            chunk = missing[start : start + self.embedding_batch_size]
+            computed.update(zip(chunk, self._request_embeddings(chunk)))
+
+        if computed and self.embedding_cache is not None:
+            self.embedding_cache.put_many(self.embedding_model, computed.items())
+
+        return [e if e is not None else computed[t] for t, e in zip(texts, cached)]
+
+    def _request_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """通过嵌入后端获取一批文本的嵌入向量"""
+        return self.embedding_backend.embed(texts)
 
     def _create_structured_snapshot(self, state: Dict) -> str:
         """
@@ -53,6 +97,21 @@ class AshareMemoryManager:
             f"- **基本面风险**: {snapshot['fundamental_risk']}"
         )
 
+    def _create_case_study(self, state: Dict, trade_outcome: Dict) -> Dict:
+        """整理一笔交易的复盘档案"""
+        return {
+            "investment_plan": state.get("investment_plan", "无"),
+            "trade_outcome": trade_outcome.get("outcome", "未知"),
+            "key_lesson": trade_outcome.get("lesson", "无经验总结")
+        }
+
+    @staticmethod
+    def _memory_id(situation_snapshot: str, case_study_json: str) -> str:
+        """根据情景快照和复盘档案内容计算记忆ID"""
+        return hashlib.sha256(
+            f"{situation_snapshot}\0{case_study_json}".encode("utf-8")
+        ).hexdigest()
+
     def add_trade_memory(self, state: Dict, trade_outcome: Dict):
         """
         A股改造核心2：添加一笔完整的交易记忆，包含情景、决策和最终结果。
@@ -60,52 +119,91 @@ class AshareMemoryManager:
         :param state: 交易决策时的完整状态 (state)
         :param trade_outcome: 交易结束后的结果，例如 {'outcome': '+5.2%', 'lesson': '政策利好与情绪共振，但入场点位过高导致利润回吐。'}
         """
-        situation_snapshot = self._create_structured_snapshot(state)
-        
-        trade_case_study = {
-            "investment_plan": state.get("investment_plan", "无"),
-            "trade_outcome": trade_outcome.get("outcome", "未知"),
-            "key_lesson": trade_outcome.get("lesson", "无经验总结")
-        }
+        self.add_trade_memories([(state, trade_outcome)])
 
-        doc_id = str(self.collection.count())
-        embedding = self._get_embedding(situation_snapshot)
-        
-        self.collection.add(
-            documents=[situation_snapshot],
-            metadatas=[{"case_study": json.dumps(trade_case_study, ensure_ascii=False)}],
-            embeddings=[embedding],
-            ids=[doc_id],
+    def add_trade_memories(self, trades: List[Tuple[Dict, Dict]]):
+        """
+        批量添加交易记忆：嵌入向量分批请求，所有记录通过一次 collection.upsert 写入。
+
+        :param trades: (state, trade_outcome) 列表，含义同 add_trade_memory
+        """
+        if not trades:
+            return
+
+        situation_snapshots = [self._create_structured_snapshot(state) for state, _ in trades]
+        case_studies = [
+            self._create_case_study(state, trade_outcome) for state, trade_outcome in trades
+        ]
+
+        metadatas = [
+            {"case_study": json.dumps(case_study, ensure_ascii=False)}
+            for case_study in case_studies
+        ]
+        # 由内容生成稳定的ID：同一条记忆重复写入时覆盖而不是重复添加
+        records = {}
+        for snapshot, metadata in zip(situation_snapshots, metadatas):
+            records[self._memory_id(snapshot, metadata["case_study"])] = (
+                snapshot,
+                metadata,
+            )
+        doc_ids = list(records)
+        situation_snapshots = [snapshot for snapshot, _ in records.values()]
+        embeddings = self._get_embeddings(situation_snapshots)
+
+        self.collection.upsert(
+            documents=situation_snapshots,
+            metadatas=[metadata for _, metadata in records.values()],
+            embeddings=embeddings,
+            ids=doc_ids,
         )
-        print(f"成功添加一条A股交易记忆，ID: {doc_id}")
+        print(f"成功添加 {len(doc_ids)} 条A股交易记忆，当前共 {self.collection.count()} 条")
 
     def get_similar_memories(self, current_state: Dict, n_matches: int = 2) -> List:
         """
         根据当前市场情况，检索最相似的历史交易复盘档案。
         """
-        current_snapshot = self._create_structured_snapshot(current_state)
-        query_embedding = self._get_embedding(current_snapshot)
+        return self.get_similar_memories_many([current_state], n_matches)[0]
+
+    def get_similar_memories_many(
+        self, current_states: List[Dict], n_matches: int = 2
+    ) -> List[List]:
+        """
+        批量检索：为每个市场情况检索最相似的历史交易复盘档案，
+        嵌入向量分批请求，所有查询通过一次 collection.query 完成。
+        """
+        if not current_states:
+            return []
+        # 记忆库为空时无需请求嵌入接口
+        if self.collection.count() == 0:
+            return [[] for _ in current_states]
+
+        current_snapshots = [
+            self._create_structured_snapshot(state) for state in current_states
+        ]
+        query_embeddings = self._get_embeddings(current_snapshots)
 
         results = self.collection.query(
-            query_embeddings=[query_embedding],
+            query_embeddings=query_embeddings,
             n_results=n_matches,
             include=["metadatas", "documents", "distances"],
         )
 
-        # --- 优化点 1: 修复语法错误 ---
-        matched_results = 
-        
-        # --- 优化点 2: 增强健壮性，检查查询结果是否有效 ---
-        if not results or not results["documents"] or not results["documents"]:
-            return matched_results # 如果没有找到任何匹配项，返回空列表
-
-        # --- 优化点 3: 修复数据访问逻辑 ---
-        # ChromaDB返回的结果是嵌套列表，需要用  来访问第一层
-        for i in range(len(results["documents"])):
-            case_study_json = results["metadatas"][i].get("case_study", "{}")
-            matched_results.append({
-                "matched_situation": results["documents"][i],
-                "case_study": json.loads(case_study_json),
-                "similarity_score": 1 - results["distances"][i],
-            })
-        return matched_results
\ No newline at end of file
+        all_matched_results = []
+        for q in range(len(current_states)):
+            matched_results = []
+
+            # 检查查询结果是否有效，没有找到任何匹配项时返回空列表
+            if not results or not results["documents"] or not results["documents"][q]:
+                all_matched_results.append(matched_results)
+                continue
+
+            # ChromaDB返回的结果是嵌套列表，第一层对应每条查询
+            for i in range(len(results["documents"][q])):
+                case_study_json = results["metadatas"][q][i].get("case_study", "{}")
+                matched_results.append({
+                    "matched_situation": results["documents"][q][i],
+                    "case_study": json.loads(case_study_json),
+                    "similarity_score": 1 - results["distances"][q][i],
+                })
+            all_matched_results.append(matched_results)
+        return all_matched_results
@@ -1,8 +1,17 @@
-from .finnhub_utils import get_data_in_range
+from .finnhub_store import get_data_in_range
 from .googlenews_utils import getNewsData
 from .yfin_utils import YFinanceUtils
-from .reddit_utils import fetch_top_from_category
+from .reddit_utils import (
+    fetch_top_from_category,
+    fetch_top_from_category_range,
+    fetch_top_from_category_range_many,
+)
 from .stockstats_utils import StockstatsUtils
+from .price_store import PriceStore, get_price_store
+from .finnhub_store import FinnhubStore, get_finnhub_store, build_finnhub_index
+from .simfin_store import SimFinStore, get_simfin_store
+from .reddit_store import RedditStore, get_reddit_store, build_reddit_index
+from .news_store import NewsStore, get_news_store
 from .yfin_utils import YFinanceUtils
 
 from .interface import (
@@ -19,6 +28,7 @@ from .interface import (
     get_simfin_income_statements,
     # Technical analysis functions
     get_stock_stats_indicators_window,
+    get_stock_stats_indicators_batch_window,
     get_stockstats_indicator,
     # Market data functions
     get_YFin_data_window,
@@ -39,6 +49,7 @@ __all__ = [
     "get_simfin_income_statements",
     # Technical analysis functions
     "get_stock_stats_indicators_window",
+    "get_stock_stats_indicators_batch_window",
     "get_stockstats_indicator",
     # Market data functions
     "get_YFin_data_window",
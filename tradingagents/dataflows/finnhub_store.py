@@ -0,0 +1,219 @@
+import json
+import os
+import sqlite3
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Annotated, Dict, Optional
+
+from .config import get_config
+
+FINNHUB_DATA_TYPES = [
+    "insider_trans",
+    "SEC_filings",
+    "news_data",
+    "insider_senti",
+    "fin_as_reported",
+]
+
+
+def finnhub_data_path(ticker, data_type, data_dir, period=None):
+    """Path of the formatted finnhub JSON file for a ticker and data type."""
+    if period:
+        return os.path.join(
+            data_dir,
+            "finnhub_data",
+            data_type,
+            f"{ticker}_{period}_data_formatted.json",
+        )
+    return os.path.join(
+        data_dir, "finnhub_data", data_type, f"{ticker}_data_formatted.json"
+    )
+
+
+class FinnhubStore:
+    """
+    Date-indexed access to the formatted finnhub JSON files.
+
+    Every `{ticker}_data_formatted.json` is ingested once into a SQLite table
+    keyed by (source file, date), so a range query only reads the requested days.
+    Files parsed in this process are also kept in an LRU keyed by
+    (ticker, data_type, period, mtime) together with their sorted date keys, so
+    repeated queries are answered by binary search without touching disk.
+    """
+
+    def __init__(
+        self,
+        db_path: Annotated[str, "path of the SQLite index file"],
+        max_files: Annotated[int, "number of parsed files kept in the in-process LRU"] = 64,
+    ):
+        self.db_path = db_path
+        self.max_files = max_files
+        self._lru: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS sources (
+                source TEXT PRIMARY KEY,
+                mtime REAL NOT NULL,
+                size INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS days (
+                source TEXT NOT NULL,
+                date TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                PRIMARY KEY (source, date)
+            ) WITHOUT ROWID;
+            """
+        )
+        self._conn.commit()
+
+    def _is_indexed(self, source: str, stat: os.stat_result) -> bool:
+        row = self._conn.execute(
+            "SELECT mtime, size FROM sources WHERE source = ?", (source,)
+        ).fetchone()
+        return row is not None and row[0] == stat.st_mtime and row[1] == stat.st_size
+
+    def _ingest(self, source: str, stat: os.stat_result, data: Dict):
+        with self._conn:
+            self._conn.execute("DELETE FROM days WHERE source = ?", (source,))
+            self._conn.executemany(
+                "INSERT INTO days (source, date, payload) VALUES (?, ?, ?)",
+                (
+                    (source, date, json.dumps(value))
+                    for date, value in data.items()
+                    if len(value) > 0
+                ),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sources (source, mtime, size) VALUES (?, ?, ?)",
+                (source, stat.st_mtime, stat.st_size),
+            )
+
+    def _index(self, source: str, stat: os.stat_result) -> Dict:
+        """Parse one JSON file and ingest it into the index, returning the parsed data."""
+        with open(source, "r") as f:
+            data = json.load(f)
+        self._ingest(source, stat, data)
+        return data
+
+    def _remember(self, cache_key: tuple, data: Dict) -> tuple:
+        entry = (sorted(data), data)
+        self._lru[cache_key] = entry
+        self._lru.move_to_end(cache_key)
+        while len(self._lru) > self.max_files:
+            self._lru.popitem(last=False)
+        return entry
+
+    def index_file(
+        self,
+        data_path: Annotated[str, "path of a formatted finnhub JSON file"],
+    ) -> bool:
+        """Ingest one JSON file into the index. Returns False if it was already up to date."""
+        source = os.path.abspath(data_path)
+        stat = os.stat(source)
+        with self._lock:
+            if self._is_indexed(source, stat):
+                return False
+            self._index(source, stat)
+            return True
+
+    def get_range(
+        self,
+        ticker: Annotated[str, "ticker symbol"],
+        start_date: Annotated[str, "Start date in YYYY-MM-DD format, inclusive"],
+        end_date: Annotated[str, "End date in YYYY-MM-DD format, inclusive"],
+        data_type: Annotated[str, "Type of data from finnhub to fetch"],
+        data_dir: Annotated[str, "Directory where the data is saved"],
+        period: Annotated[Optional[str], "annual or quarterly, if any"] = None,
+    ) -> Dict:
+        """
+        Return {date: entries} for every non-empty day within the range.
+
+        A file that is not indexed yet (or changed since) is indexed on first
+        access and its parsed data is kept in the LRU; files indexed earlier,
+        e.g. by build_finnhub_index or another process, are queried by date.
+        """
+        source = os.path.abspath(finnhub_data_path(ticker, data_type, data_dir, period))
+        stat = os.stat(source)
+        cache_key = (ticker, data_type, period, stat.st_mtime)
+
+        with self._lock:
+            entry = self._lru.get(cache_key)
+            if entry is not None:
+                self._lru.move_to_end(cache_key)
+            elif self._is_indexed(source, stat):
+                rows = self._conn.execute(
+                    "SELECT date, payload FROM days "
+                    "WHERE source = ? AND date >= ? AND date <= ? ORDER BY date",
+                    (source, start_date, end_date),
+                ).fetchall()
+                return {date: json.loads(payload) for date, payload in rows}
+            else:
+                entry = self._remember(cache_key, self._index(source, stat))
+
+        keys, data = entry
+        lo = bisect_left(keys, start_date)
+        hi = bisect_right(keys, end_date)
+        return {key: data[key] for key in keys[lo:hi] if len(data[key]) > 0}
+
+    def clear(self):
+        """Drop every parsed file from the in-process LRU."""
+        with self._lock:
+            self._lru.clear()
+
+
+_finnhub_store: Optional[FinnhubStore] = None
+
+
+def get_finnhub_store() -> FinnhubStore:
+    """Get the process-wide finnhub store, creating it from the current config."""
+    global _finnhub_store
+    config = get_config()
+    db_path = os.path.join(config["data_cache_dir"], "finnhub_index.sqlite")
+    if _finnhub_store is None or _finnhub_store.db_path != db_path:
+        _finnhub_store = FinnhubStore(
+            db_path, max_files=config.get("finnhub_store_max_files", 64)
+        )
+    return _finnhub_store
+
+
+def build_finnhub_index(
+    data_dir: Annotated[str, "Directory where the finnhub_data folder is saved"],
+) -> int:
+    """
+    Preprocess the whole finnhub_data directory into the date index.
+    Returns the number of files that were (re)indexed.
+    """
+    store = get_finnhub_store()
+    indexed = 0
+    for data_type in FINNHUB_DATA_TYPES:
+        type_dir = os.path.join(data_dir, "finnhub_data", data_type)
+        if not os.path.isdir(type_dir):
+            continue
+        for file_name in sorted(os.listdir(type_dir)):
+            if not file_name.endswith("_data_formatted.json"):
+                continue
+            if store.index_file(os.path.join(type_dir, file_name)):
+                indexed += 1
+    return indexed
+
+
+def get_data_in_range(ticker, start_date, end_date, data_type, data_dir, period=None):
+    """
+    Gets finnhub data saved and processed on disk.
+    Args:
+        start_date (str): Start date in YYYY-MM-DD format.
+        end_date (str): End date in YYYY-MM-DD format.
+        data_type (str): Type of data from finnhub to fetch. Can be insider_trans, SEC_filings, news_data, insider_senti, or fin_as_reported.
+        data_dir (str): Directory where the data is saved.
+        period (str): Default to none, if there is a period specified, should be annual or quarterly.
+    """
+
+    # served from the date index / parsed-file cache instead of re-loading the whole JSON
+    return get_finnhub_store().get_range(
+        ticker, start_date, end_date, data_type, data_dir, period=period
+    )
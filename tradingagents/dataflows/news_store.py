@@ -0,0 +1,102 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Annotated, Dict, List, Optional, Tuple
+
+from .config import get_config
+
+
+class NewsStore:
+    """
+    Persistent cache of scraped Google News result pages.
+
+    Each page is stored parsed, keyed by (query, start date, end date, page),
+    together with whether the page had a "Next" link, so replaying a search
+    over the same window needs no network round trips at all.
+    """
+
+    def __init__(self, db_path: Annotated[str, "path of the SQLite cache file"]):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                query TEXT NOT NULL,
+                start_date TEXT NOT NULL,
+                end_date TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                results TEXT NOT NULL,
+                has_next INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (query, start_date, end_date, page)
+            ) WITHOUT ROWID;
+            """
+        )
+        self._conn.commit()
+
+    def get_page(
+        self,
+        query: Annotated[str, "search query"],
+        start_date: Annotated[str, "start date in mm/dd/yyyy format"],
+        end_date: Annotated[str, "end date in mm/dd/yyyy format"],
+        page: Annotated[int, "zero-based result page"],
+    ) -> Optional[Tuple[List[Dict], bool]]:
+        """Return (results, has_next) for a cached page, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT results, has_next FROM pages "
+                "WHERE query = ? AND start_date = ? AND end_date = ? AND page = ?",
+                (query, start_date, end_date, page),
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), bool(row[1])
+
+    def put_page(
+        self,
+        query: Annotated[str, "search query"],
+        start_date: Annotated[str, "start date in mm/dd/yyyy format"],
+        end_date: Annotated[str, "end date in mm/dd/yyyy format"],
+        page: Annotated[int, "zero-based result page"],
+        results: Annotated[List[Dict], "parsed results of the page"],
+        has_next: Annotated[bool, "whether the page links to a next page"],
+    ):
+        """Store the parsed results of one page."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages "
+                "(query, start_date, end_date, page, results, has_next, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    query,
+                    start_date,
+                    end_date,
+                    page,
+                    json.dumps(results),
+                    int(has_next),
+                    time.time(),
+                ),
+            )
+
+    def clear(self):
+        """Drop every cached page."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM pages")
+
+
+_news_store: Optional[NewsStore] = None
+
+
+def get_news_store() -> NewsStore:
+    """Get the process-wide news store, creating it from the current config."""
+    global _news_store
+    config = get_config()
+    db_path = os.path.join(config["data_cache_dir"], "google_news_cache.sqlite")
+    if _news_store is None or _news_store.db_path != db_path:
+        _news_store = NewsStore(db_path)
+    return _news_store
@@ -1,7 +1,10 @@
 import json
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import threading
 import time
 import random
 from tenacity import (
@@ -11,6 +14,72 @@ from tenacity import (
     retry_if_exception_type,
     retry_if_result,
 )
+from .config import get_config
+from .news_store import get_news_store
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: up to `capacity` requests may go out back to back,
+    after which requests are spaced at `rate` per second.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._last) * self.rate
+                )
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            # small jitter so concurrent callers do not fire in lockstep
+            time.sleep(wait + random.uniform(0, 0.1 * wait))
+
+
+_session = None
+_rate_limiter = None
+_client_lock = threading.Lock()
+
+
+def _get_session():
+    """Shared session with a bounded connection pool."""
+    global _session
+    with _client_lock:
+        if _session is None:
+            pool_size = get_config().get("google_news_pool_size", 4)
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=pool_size, pool_maxsize=pool_size, pool_block=True
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def _get_rate_limiter():
+    """Shared token bucket limiting the request rate across threads."""
+    global _rate_limiter
+    with _client_lock:
+        if _rate_limiter is None:
+            config = get_config()
+            _rate_limiter = TokenBucket(
+                rate=config.get("google_news_requests_per_second", 0.25),
+                capacity=config.get("google_news_burst", 2),
+            )
+        return _rate_limiter
 
 
 def is_rate_limited(response):
@@ -25,12 +94,69 @@ def is_rate_limited(response):
 )
 def make_request(url, headers):
     """Make a request with retry logic for rate limiting"""
-    # Random delay before each request to avoid detection
-    time.sleep(random.uniform(2, 6))
-    response = requests.get(url, headers=headers)
+    # Wait for the shared rate limiter instead of sleeping blindly
+    _get_rate_limiter().acquire()
+    response = _get_session().get(url, headers=headers)
     return response
 
 
+def _is_final_window(end_date):
+    """Whether the mm/dd/yyyy end date is in the past, so its results can no longer change."""
+    return datetime.strptime(end_date, "%m/%d/%Y").date() < datetime.now().date()
+
+
+def _fetch_page(query, start_date, end_date, page, headers):
+    """
+    Return (results, has_next) for one result page, from the news cache when
+    possible. Pages of windows that ended before today are cached.
+    """
+    news_store = get_news_store()
+    cached = news_store.get_page(query, start_date, end_date, page)
+    if cached is not None:
+        return cached
+
+    offset = page * 10
+    url = (
+        f"https://www.google.com/search?q={query}"
+        f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
+        f"&tbm=nws&start={offset}"
+    )
+
+    response = make_request(url, headers)
+    soup = BeautifulSoup(response.content, "html.parser")
+    results_on_page = soup.select("div.SoaBEf")
+
+    page_results = []
+    for el in results_on_page:
+        try:
+            link = el.find("a")["href"]
+            title = el.select_one("div.MBeuO").get_text()
+            snippet = el.select_one(".GI74Re").get_text()
+            date = el.select_one(".LfVVr").get_text()
+            source = el.select_one(".NUnG9d span").get_text()
+            page_results.append(
+                {
+                    "link": link,
+                    "title": title,
+                    "snippet": snippet,
+                    "date": date,
+                    "source": source,
+                }
+            )
+        except Exception as e:
+            print(f"Error processing result: {e}")
+            # If one of the fields is not found, skip this result
+            continue
+
+    # Check for the "Next" link (pagination)
+    has_next = bool(results_on_page) and soup.find("a", id="pnnext") is not None
+
+    if response.status_code == 200 and _is_final_window(end_date):
+        news_store.put_page(query, start_date, end_date, page, page_results, has_next)
+
+    return page_results, has_next
+
+
 def getNewsData(query, start_date, end_date):
     """
     Scrape Google News search results for a given query and date range.
@@ -56,47 +182,14 @@ def getNewsData(query, start_date, end_date):
     news_results = []
     page = 0
     while True:
-        offset = page * 10
-        url = (
-            f"https://www.google.com/search?q={query}"
-            f"&tbs=cdr:1,cd_min:{start_date},cd_max:{end_date}"
-            f"&tbm=nws&start={offset}"
-        )
-
         try:
-            response = make_request(url, headers)
-            soup = BeautifulSoup(response.content, "html.parser")
-            results_on_page = soup.select("div.SoaBEf")
-
-            if not results_on_page:
-                break  # No more results found
-
-            for el in results_on_page:
-                try:
-                    link = el.find("a")["href"]
-                    title = el.select_one("div.MBeuO").get_text()
-                    snippet = el.select_one(".GI74Re").get_text()
-                    date = el.select_one(".LfVVr").get_text()
-                    source = el.select_one(".NUnG9d span").get_text()
-                    news_results.append(
-                        {
-                            "link": link,
-                            "title": title,
-                            "snippet": snippet,
-                            "date": date,
-                            "source": source,
-                        }
-                    )
-                except Exception as e:
-                    print(f"Error processing result: {e}")
-                    # If one of the fields is not found, skip this result
-                    continue
-
-            # Update the progress bar with the current count of results scraped
-
-            # Check for the "Next" link (pagination)
-            next_link = soup.find("a", id="pnnext")
-            if not next_link:
+            page_results, has_next = _fetch_page(
+                query, start_date, end_date, page, headers
+            )
+            news_results.extend(page_results)
+
+            # No more results found, or no "Next" link
+            if not has_next:
                 break
 
             page += 1
@@ -106,3 +199,18 @@ def getNewsData(query, start_date, end_date):
             break
 
     return news_results
+
+
+def getNewsDataMany(searches, max_workers=None):
+    """
+    Run several getNewsData searches concurrently.
+    searches: list of (query, start_date, end_date) tuples
+    max_workers: number of searches in flight, defaults to the session pool size
+    Returns the results in the order of `searches`. All searches share the
+    connection pool, the rate limiter and the response cache.
+    """
+    if max_workers is None:
+        max_workers = get_config().get("google_news_pool_size", 4)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda search: getNewsData(*search), searches))
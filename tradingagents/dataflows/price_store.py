@@ -0,0 +1,182 @@
+import json
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from typing import Annotated, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+
+PRICE_FILE_TEMPLATE = "{symbol}-YFin-data-2015-01-01-2025-03-25.csv"
+DATE_COLUMN = "Date"
+
+
+def date_to_key(date: str) -> int:
+    """Convert a YYYY-mm-dd (or longer timestamp) string into an int64 YYYYmmdd key."""
+    return int(date[:10].replace("-", ""))
+
+
+class PriceStore:
+    """
+    Columnar, memory-mapped store for the offline Yahoo Finance price CSVs.
+
+    Each `{symbol}-YFin-data-...csv` is converted once into a directory of `.npy`
+    column files plus a sorted int64 date key array. Loaded tickers are kept in an
+    in-process LRU and date-range slices are answered with a binary search on the
+    key array instead of re-parsing and string-filtering the CSV.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Annotated[str, "directory holding the converted column files"],
+        max_tickers: Annotated[int, "number of tickers kept in the in-process LRU"] = 32,
+    ):
+        self.cache_dir = cache_dir
+        self.max_tickers = max_tickers
+        self._lru: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _csv_path(self, symbol: str, data_dir: str) -> str:
+        return os.path.join(data_dir, PRICE_FILE_TEMPLATE.format(symbol=symbol))
+
+    def _store_path(self, symbol: str) -> str:
+        return os.path.join(self.cache_dir, symbol)
+
+    def _convert(self, csv_path: str, store_path: str, source_stat: os.stat_result):
+        """Convert one price CSV into column files sorted by date."""
+        data = pd.read_csv(csv_path)
+        keys = data[DATE_COLUMN].astype(str).map(date_to_key).to_numpy(dtype=np.int64)
+        order = np.argsort(keys, kind="stable")
+
+        tmp_path = f"{store_path}.tmp-{os.getpid()}"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        os.makedirs(tmp_path)
+
+        np.save(os.path.join(tmp_path, "_keys.npy"), keys[order])
+        columns = []
+        for i, column in enumerate(data.columns):
+            values = data[column].to_numpy()[order]
+            if values.dtype == object:
+                values = values.astype(str)
+            file_name = f"{i}.npy"
+            np.save(os.path.join(tmp_path, file_name), values)
+            columns.append({"name": column, "file": file_name})
+
+        meta = {
+            "source": os.path.abspath(csv_path),
+            "source_mtime": source_stat.st_mtime,
+            "source_size": source_stat.st_size,
+            "columns": columns,
+        }
+        with open(os.path.join(tmp_path, "meta.json"), "w") as f:
+            json.dump(meta, f)
+
+        shutil.rmtree(store_path, ignore_errors=True)
+        os.replace(tmp_path, store_path)
+
+    def _read_meta(self, store_path: str) -> Optional[Dict]:
+        try:
+            with open(os.path.join(store_path, "meta.json"), "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _open(self, symbol: str, data_dir: str) -> Dict:
+        csv_path = self._csv_path(symbol, data_dir)
+        source_stat = os.stat(csv_path)  # raises FileNotFoundError like pd.read_csv
+        store_path = self._store_path(symbol)
+
+        meta = self._read_meta(store_path)
+        if (
+            meta is None
+            or meta["source"] != os.path.abspath(csv_path)
+            or meta["source_mtime"] != source_stat.st_mtime
+            or meta["source_size"] != source_stat.st_size
+        ):
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._convert(csv_path, store_path, source_stat)
+            meta = self._read_meta(store_path)
+
+        return {
+            "mtime": source_stat.st_mtime,
+            "keys": np.load(os.path.join(store_path, "_keys.npy"), mmap_mode="r"),
+            "columns": [
+                (col["name"], np.load(os.path.join(store_path, col["file"]), mmap_mode="r"))
+                for col in meta["columns"]
+            ],
+        }
+
+    def _get(self, symbol: str, data_dir: str) -> Dict:
+        lru_key = self._csv_path(symbol, data_dir)
+        with self._lock:
+            entry = self._lru.get(lru_key)
+            if entry is not None and entry["mtime"] == os.stat(lru_key).st_mtime:
+                self._lru.move_to_end(lru_key)
+                return entry
+
+            entry = self._open(symbol, data_dir)
+            self._lru[lru_key] = entry
+            self._lru.move_to_end(lru_key)
+            while len(self._lru) > self.max_tickers:
+                self._lru.popitem(last=False)
+            return entry
+
+    def _frame(self, entry: Dict, lo: int, hi: int) -> pd.DataFrame:
+        return pd.DataFrame(
+            {name: np.array(values[lo:hi]) for name, values in entry["columns"]},
+            index=pd.RangeIndex(lo, hi),
+        )
+
+    def load(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        data_dir: Annotated[str, "directory where the price CSVs are stored"],
+    ) -> pd.DataFrame:
+        """Return the full price history for a ticker as a fresh DataFrame."""
+        entry = self._get(symbol, data_dir)
+        return self._frame(entry, 0, len(entry["keys"]))
+
+    def get_range(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        data_dir: Annotated[str, "directory where the price CSVs are stored"],
+        start_date: Annotated[str, "Start date in yyyy-mm-dd format, inclusive"],
+        end_date: Annotated[str, "End date in yyyy-mm-dd format, inclusive"],
+    ) -> pd.DataFrame:
+        """Return the rows between start_date and end_date (inclusive)."""
+        entry = self._get(symbol, data_dir)
+        keys = entry["keys"]
+        lo = int(np.searchsorted(keys, date_to_key(start_date), side="left"))
+        hi = int(np.searchsorted(keys, date_to_key(end_date), side="right"))
+        return self._frame(entry, lo, max(lo, hi))
+
+    def trading_dates(
+        self,
+        symbol: Annotated[str, "ticker symbol of the company"],
+        data_dir: Annotated[str, "directory where the price CSVs are stored"],
+    ) -> np.ndarray:
+        """Return the sorted int64 YYYYmmdd keys of all trading dates on file."""
+        return self._get(symbol, data_dir)["keys"]
+
+    def clear(self):
+        """Drop every ticker from the in-process LRU."""
+        with self._lock:
+            self._lru.clear()
+
+
+_price_store: Optional[PriceStore] = None
+
+
+def get_price_store() -> PriceStore:
+    """Get the process-wide price store, creating it from the current config."""
+    global _price_store
+    config = get_config()
+    cache_dir = os.path.join(config["data_cache_dir"], "price_store")
+    if _price_store is None or _price_store.cache_dir != cache_dir:
+        _price_store = PriceStore(
+            cache_dir, max_tickers=config.get("price_store_max_tickers", 32)
+        )
+    return _price_store
@@ -0,0 +1,239 @@
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Annotated, Callable, Dict, Hashable, Iterable, List, Optional
+
+from .config import get_config
+
+
+class RedditStore:
+    """
+    On-disk index of the reddit `.jsonl` corpus bucketed by
+    (category, subreddit, UTC date).
+
+    Every subreddit file is parsed once and its posts are written to a SQLite
+    table ordered by that key, so a whole date span is answered with one range
+    query instead of re-reading the category directory for every day. Files are
+    re-indexed automatically when their mtime or size changes.
+    """
+
+    def __init__(self, db_path: Annotated[str, "path of the SQLite index file"]):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS sources (
+                source TEXT PRIMARY KEY,
+                mtime REAL NOT NULL,
+                size INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS posts (
+                category_dir TEXT NOT NULL,
+                subreddit TEXT NOT NULL,
+                date TEXT NOT NULL,
+                line_no INTEGER NOT NULL,
+                upvotes INTEGER NOT NULL,
+                title TEXT NOT NULL,
+                content TEXT NOT NULL,
+                url TEXT NOT NULL,
+                PRIMARY KEY (category_dir, date, subreddit, line_no)
+            ) WITHOUT ROWID;
+            """
+        )
+        self._conn.commit()
+
+    def _index_file(self, category_dir: str, data_file: str):
+        source = os.path.join(category_dir, data_file)
+        stat = os.stat(source)
+        row = self._conn.execute(
+            "SELECT mtime, size FROM sources WHERE source = ?", (source,)
+        ).fetchone()
+        if row is not None and row[0] == stat.st_mtime and row[1] == stat.st_size:
+            return False
+
+        posts = []
+        with open(source, "rb") as f:
+            for i, line in enumerate(f):
+                # skip empty lines
+                if not line.strip():
+                    continue
+
+                parsed_line = json.loads(line)
+                post_date = datetime.utcfromtimestamp(
+                    parsed_line["created_utc"]
+                ).strftime("%Y-%m-%d")
+                posts.append(
+                    (
+                        category_dir,
+                        data_file,
+                        post_date,
+                        i,
+                        parsed_line["ups"],
+                        parsed_line["title"],
+                        parsed_line["selftext"],
+                        parsed_line["url"],
+                    )
+                )
+
+        with self._conn:
+            self._conn.execute(
+                "DELETE FROM posts WHERE category_dir = ? AND subreddit = ?",
+                (category_dir, data_file),
+            )
+            self._conn.executemany(
+                "INSERT INTO posts (category_dir, subreddit, date, line_no, upvotes, "
+                "title, content, url) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                posts,
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sources (source, mtime, size) VALUES (?, ?, ?)",
+                (source, stat.st_mtime, stat.st_size),
+            )
+        return True
+
+    def index_category(
+        self,
+        category_dir: Annotated[str, "directory holding one category's .jsonl files"],
+    ) -> int:
+        """Bring the index up to date for one category. Returns the number of files re-indexed."""
+        category_dir = os.path.abspath(category_dir)
+        indexed = 0
+        with self._lock:
+            for data_file in os.listdir(category_dir):
+                if data_file.endswith(".jsonl") and self._index_file(
+                    category_dir, data_file
+                ):
+                    indexed += 1
+        return indexed
+
+    def _query(self, category_dir: str, start_date: str, end_date: str):
+        self.index_category(category_dir)
+        category_dir = os.path.abspath(category_dir)
+        subreddit_order = {
+            name: i for i, name in enumerate(os.listdir(category_dir))
+        }
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT date, subreddit, upvotes, title, content, url FROM posts "
+                "WHERE category_dir = ? AND date >= ? AND date <= ? "
+                "ORDER BY date, subreddit, upvotes DESC, line_no",
+                (category_dir, start_date, end_date),
+            ).fetchall()
+        return subreddit_order, rows
+
+    def top_posts_many(
+        self,
+        category_dir: Annotated[str, "directory holding one category's .jsonl files"],
+        start_date: Annotated[str, "Start date in yyyy-mm-dd format, inclusive"],
+        end_date: Annotated[str, "End date in yyyy-mm-dd format, inclusive"],
+        limit_per_subreddit: Annotated[int, "posts kept per subreddit per day and key"],
+        keys: Annotated[List[Hashable], "keys to collect posts for"],
+        post_matcher: Annotated[
+            Callable[[str, str], Iterable[Hashable]],
+            "returns the keys a post with (title, content) belongs to",
+        ],
+    ) -> Dict[Hashable, Dict[str, List[Dict]]]:
+        """
+        Like top_posts, but collects posts for several keys in one pass over the
+        span. Each post is matched once and kept for every key it belongs to.
+        Returns {key: {date: posts}}.
+        """
+        subreddit_order, rows = self._query(category_dir, start_date, end_date)
+
+        buckets: Dict[Hashable, Dict[str, Dict[str, List[Dict]]]] = {
+            key: {} for key in keys
+        }
+        for date, subreddit, upvotes, title, content, url in rows:
+            if subreddit not in subreddit_order:
+                continue
+            post = None
+            for key in post_matcher(title, content):
+                selected = buckets[key].setdefault(date, {}).setdefault(subreddit, [])
+                if len(selected) >= limit_per_subreddit:
+                    continue
+                if post is None:
+                    post = {
+                        "title": title,
+                        "content": content,
+                        "url": url,
+                        "upvotes": upvotes,
+                        "posted_date": date,
+                    }
+                selected.append(post)
+
+        return {
+            key: {
+                date: [
+                    post
+                    for subreddit in sorted(by_subreddit, key=subreddit_order.get)
+                    for post in by_subreddit[subreddit]
+                ]
+                for date, by_subreddit in sorted(by_date.items())
+            }
+            for key, by_date in buckets.items()
+        }
+
+    def top_posts(
+        self,
+        category_dir: Annotated[str, "directory holding one category's .jsonl files"],
+        start_date: Annotated[str, "Start date in yyyy-mm-dd format, inclusive"],
+        end_date: Annotated[str, "End date in yyyy-mm-dd format, inclusive"],
+        limit_per_subreddit: Annotated[int, "posts kept per subreddit per day"],
+        post_filter: Annotated[
+            Optional[Callable[[str, str], bool]],
+            "optional predicate on (title, content) a post must satisfy",
+        ] = None,
+    ) -> Dict[str, List[Dict]]:
+        """
+        Return {date: posts} for every day in the span, keeping the top posts by
+        upvotes of each subreddit, with subreddits in directory listing order.
+        """
+        if post_filter is None:
+            post_matcher = lambda title, content: (None,)
+        else:
+            post_matcher = lambda title, content: (
+                (None,) if post_filter(title, content) else ()
+            )
+        return self.top_posts_many(
+            category_dir,
+            start_date,
+            end_date,
+            limit_per_subreddit,
+            [None],
+            post_matcher,
+        )[None]
+
+
+_reddit_store: Optional[RedditStore] = None
+
+
+def get_reddit_store() -> RedditStore:
+    """Get the process-wide reddit store, creating it from the current config."""
+    global _reddit_store
+    config = get_config()
+    db_path = os.path.join(config["data_cache_dir"], "reddit_index.sqlite")
+    if _reddit_store is None or _reddit_store.db_path != db_path:
+        _reddit_store = RedditStore(db_path)
+    return _reddit_store
+
+
+def build_reddit_index(
+    data_path: Annotated[str, "Path to the reddit data folder"],
+) -> int:
+    """
+    Preprocess every category under the reddit data folder into the index.
+    Returns the number of files that were (re)indexed.
+    """
+    store = get_reddit_store()
+    indexed = 0
+    for category in sorted(os.listdir(data_path)):
+        category_dir = os.path.join(data_path, category)
+        if os.path.isdir(category_dir):
+            indexed += store.index_category(category_dir)
+    return indexed
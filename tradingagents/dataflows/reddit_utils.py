@@ -1,11 +1,11 @@
 import requests
 import time
-import json
-from datetime import datetime, timedelta
 from contextlib import contextmanager
-from typing import Annotated
+from functools import lru_cache
+from typing import Annotated, Dict, List
 import os
 import re
+from .reddit_store import get_reddit_store
 
 ticker_to_company = {
     "AAPL": "Apple",
@@ -49,87 +49,166 @@ ticker_to_company = {
 }
 
 
-def fetch_top_from_category(
+@lru_cache(maxsize=None)
+def compile_ticker_matcher(
+    query: Annotated[str, "ticker symbol of the company"],
+) -> re.Pattern:
+    """
+    Compile one case-insensitive alternation of the company's search terms
+    (its names from ticker_to_company plus the ticker itself). Cached per ticker.
+    """
+    if "OR" in ticker_to_company[query]:
+        search_terms = ticker_to_company[query].split(" OR ")
+    else:
+        search_terms = [ticker_to_company[query]]
+
+    search_terms.append(query)
+
+    return re.compile(
+        "|".join(f"(?:{term})" for term in search_terms), re.IGNORECASE
+    )
+
+
+def _company_post_filter(query: str):
+    """Predicate keeping posts whose title or content mentions the company (query)."""
+    pattern = compile_ticker_matcher(query)
+
+    def post_filter(title, content):
+        return pattern.search(title) is not None or pattern.search(content) is not None
+
+    return post_filter
+
+
+def _multi_company_post_matcher(queries: List[str]):
+    """
+    Matcher returning the tickers whose company a post mentions. One combined
+    alternation over every ticker's terms rejects the (usually many) posts that
+    mention none of them in a single scan; only hits are checked per ticker.
+    """
+    patterns = [(query, compile_ticker_matcher(query)) for query in queries]
+    combined = re.compile(
+        "|".join(f"(?:{pattern.pattern})" for _, pattern in patterns), re.IGNORECASE
+    )
+
+    def post_matcher(title, content):
+        if combined.search(title) is None and combined.search(content) is None:
+            return ()
+        return [
+            query
+            for query, pattern in patterns
+            if pattern.search(title) is not None or pattern.search(content) is not None
+        ]
+
+    return post_matcher
+
+
+def fetch_top_from_category_range(
     category: Annotated[
         str, "Category to fetch top post from. Collection of subreddits."
     ],
-    date: Annotated[str, "Date to fetch top posts from."],
-    max_limit: Annotated[int, "Maximum number of posts to fetch."],
+    start_date: Annotated[str, "First date to fetch top posts from, yyyy-mm-dd."],
+    end_date: Annotated[str, "Last date to fetch top posts from, yyyy-mm-dd."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch per day."],
     query: Annotated[str, "Optional query to search for in the subreddit."] = None,
     data_path: Annotated[
         str,
         "Path to the data folder. Default is 'reddit_data'.",
     ] = "reddit_data",
 ):
+    """
+    Fetch the top posts of every day in [start_date, end_date] with a single
+    query against the reddit index, in date order.
+    """
     base_path = data_path
+    category_dir = os.path.join(base_path, category)
 
-    all_content = []
-
-    if max_limit < len(os.listdir(os.path.join(base_path, category))):
+    if max_limit < len(os.listdir(category_dir)):
         raise ValueError(
             "REDDIT FETCHING ERROR: max limit is less than the number of files in the category. Will not be able to fetch any posts"
         )
 
-    limit_per_subreddit = max_limit // len(
-        os.listdir(os.path.join(base_path, category))
-    )
+    limit_per_subreddit = max_limit // len(os.listdir(category_dir))
 
-    for data_file in os.listdir(os.path.join(base_path, category)):
-        # check if data_file is a .jsonl file
-        if not data_file.endswith(".jsonl"):
-            continue
+    # if is company_news, check that the title or the content has the company's name (query) mentioned
+    post_filter = None
+    if "company" in category and query:
+        post_filter = _company_post_filter(query)
 
-        all_content_curr_subreddit = []
-
-        with open(os.path.join(base_path, category, data_file), "rb") as f:
-            for i, line in enumerate(f):
-                # skip empty lines
-                if not line.strip():
-                    continue
-
-                parsed_line = json.loads(line)
+    posts_by_date = get_reddit_store().top_posts(
+        category_dir, start_date, end_date, limit_per_subreddit, post_filter
+    )
 
-                # select only lines that are from the date
-                post_date = datetime.utcfromtimestamp(
-                    parsed_line["created_utc"]
-                ).strftime("%Y-%m-%d")
-                if post_date != date:
-                    continue
+    all_content = []
+    for posts in posts_by_date.values():
+        all_content.extend(posts)
 
-                # if is company_news, check that the title or the content has the company's name (query) mentioned
-                if "company" in category and query:
-                    search_terms = []
-                    if "OR" in ticker_to_company[query]:
-                        search_terms = ticker_to_company[query].split(" OR ")
-                    else:
-                        search_terms = [ticker_to_company[query]]
+    return all_content
 
-                    search_terms.append(query)
 
-                    found = False
-                    for term in search_terms:
-                        if re.search(
-                            term, parsed_line["title"], re.IGNORECASE
-                        ) or re.search(term, parsed_line["selftext"], re.IGNORECASE):
-                            found = True
-                            break
+def fetch_top_from_category_range_many(
+    category: Annotated[
+        str, "Category to fetch top post from. Collection of subreddits."
+    ],
+    start_date: Annotated[str, "First date to fetch top posts from, yyyy-mm-dd."],
+    end_date: Annotated[str, "Last date to fetch top posts from, yyyy-mm-dd."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch per day."],
+    queries: Annotated[List[str], "Ticker symbols to search for in the subreddit."],
+    data_path: Annotated[
+        str,
+        "Path to the data folder. Default is 'reddit_data'.",
+    ] = "reddit_data",
+) -> Dict[str, List]:
+    """
+    Multi-ticker version of fetch_top_from_category_range that scans the
+    category once for all tickers. Returns {ticker: posts}, each list equal to
+    what fetch_top_from_category_range would return for that ticker.
+    """
+    base_path = data_path
+    category_dir = os.path.join(base_path, category)
 
-                    if not found:
-                        continue
+    if max_limit < len(os.listdir(category_dir)):
+        raise ValueError(
+            "REDDIT FETCHING ERROR: max limit is less than the number of files in the category. Will not be able to fetch any posts"
+        )
 
-                post = {
-                    "title": parsed_line["title"],
-                    "content": parsed_line["selftext"],
-                    "url": parsed_line["url"],
-                    "upvotes": parsed_line["ups"],
-                    "posted_date": post_date,
-                }
+    limit_per_subreddit = max_limit // len(os.listdir(category_dir))
+
+    queries = list(dict.fromkeys(queries))
+    if "company" in category:
+        post_matcher = _multi_company_post_matcher(queries)
+    else:
+        post_matcher = lambda title, content: queries
+
+    posts_by_query = get_reddit_store().top_posts_many(
+        category_dir,
+        start_date,
+        end_date,
+        limit_per_subreddit,
+        queries,
+        post_matcher,
+    )
 
-                all_content_curr_subreddit.append(post)
+    all_content = {}
+    for query, posts_by_date in posts_by_query.items():
+        all_content[query] = []
+        for posts in posts_by_date.values():
+            all_content[query].extend(posts)
 
-        # sort all_content_curr_subreddit by upvote_ratio in descending order
-        all_content_curr_subreddit.sort(key=lambda x: x["upvotes"], reverse=True)
+    return all_content
 
-        all_content.extend(all_content_curr_subreddit[:limit_per_subreddit])
 
-    return all_content
+def fetch_top_from_category(
+    category: Annotated[
+        str, "Category to fetch top post from. Collection of subreddits."
+    ],
+    date: Annotated[str, "Date to fetch top posts from."],
+    max_limit: Annotated[int, "Maximum number of posts to fetch."],
+    query: Annotated[str, "Optional query to search for in the subreddit."] = None,
+    data_path: Annotated[
+        str,
+        "Path to the data folder. Default is 'reddit_data'.",
+    ] = "reddit_data",
+):
+    return fetch_top_from_category_range(
+        category, date, date, max_limit, query, data_path=data_path
+    )
@@ -0,0 +1,139 @@
+import os
+import threading
+from typing import Annotated, Dict, Optional
+
+import pandas as pd
+
+from .config import get_config
+
+
+class SimFinStore:
+    """
+    Process-wide cache of the US-wide SimFin statement CSVs.
+
+    Each statement file is read and its date columns are parsed once per process.
+    Rows are kept sorted under a (Ticker, Publish Date) MultiIndex, so the latest
+    report published on or before a date is found with a searchsorted lookup
+    instead of a boolean filter over every company. When parquet_cache_dir is set
+    the parsed frame is also written to Parquet, keyed by the source file mtime,
+    so later processes can skip CSV parsing.
+    """
+
+    def __init__(
+        self,
+        parquet_cache_dir: Annotated[
+            Optional[str], "directory for the Parquet cache, None to disable"
+        ] = None,
+    ):
+        self.parquet_cache_dir = parquet_cache_dir
+        self._frames: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def _parquet_path(self, data_path: str, stat: os.stat_result) -> str:
+        base = os.path.splitext(os.path.basename(data_path))[0]
+        return os.path.join(self.parquet_cache_dir, f"{base}-{stat.st_mtime_ns}.parquet")
+
+    def _read_source(self, data_path: str, stat: os.stat_result) -> pd.DataFrame:
+        parquet_path = None
+        if self.parquet_cache_dir:
+            parquet_path = self._parquet_path(data_path, stat)
+            if os.path.exists(parquet_path):
+                try:
+                    return pd.read_parquet(parquet_path)
+                except ImportError:
+                    parquet_path = None
+
+        df = pd.read_csv(data_path, sep=";")
+
+        # Convert date strings to datetime objects and remove any time components
+        df["Report Date"] = pd.to_datetime(df["Report Date"], utc=True).dt.normalize()
+        df["Publish Date"] = pd.to_datetime(df["Publish Date"], utc=True).dt.normalize()
+
+        if parquet_path:
+            try:
+                os.makedirs(self.parquet_cache_dir, exist_ok=True)
+                df.to_parquet(parquet_path)
+            except ImportError:
+                # no Parquet engine installed, keep the in-process cache only
+                pass
+
+        return df
+
+    def _load(self, data_path: str) -> Dict:
+        stat = os.stat(data_path)
+        with self._lock:
+            entry = self._frames.get(data_path)
+            if entry is not None and entry["mtime"] == stat.st_mtime_ns:
+                return entry
+
+            df = self._read_source(data_path, stat)
+            # remember the original row labels so returned rows print as before
+            df["_row"] = df.index
+            # rows without a publish date can never match a lookup
+            df = df[df["Publish Date"].notna()]
+            df = df.set_index(["Ticker", "Publish Date"], drop=False).sort_index(
+                kind="mergesort"
+            )
+            entry = {
+                "mtime": stat.st_mtime_ns,
+                "frame": df,
+                # publish dates as int64 nanoseconds for searchsorted
+                "publish": df.index.get_level_values("Publish Date").asi8,
+            }
+            self._frames[data_path] = entry
+            return entry
+
+    def get_latest(
+        self,
+        data_path: Annotated[str, "path of the SimFin statement CSV"],
+        ticker: Annotated[str, "ticker symbol"],
+        curr_date: Annotated[str, "current date you are trading at, yyyy-mm-dd"],
+    ) -> Optional[pd.Series]:
+        """
+        Return the most recent statement row for the ticker that was published on
+        or before curr_date, or None if there is none.
+        """
+        entry = self._load(data_path)
+        df = entry["frame"]
+        curr_date_dt = pd.to_datetime(curr_date, utc=True).normalize()
+
+        try:
+            # contiguous block of the ticker's rows on the sorted first level
+            rows = df.index.get_loc(ticker)
+        except KeyError:
+            return None
+        if not isinstance(rows, slice):
+            return None
+
+        publish = entry["publish"][rows]
+        pos = publish.searchsorted(curr_date_dt.value, side="right") - 1
+        if pos < 0:
+            return None
+
+        # on ties, keep the first row of that publish date like idxmax would
+        pos = publish.searchsorted(publish[pos], side="left")
+
+        row = df.iloc[rows.start + pos]
+        return row.drop("_row").rename(row["_row"])
+
+    def clear(self):
+        """Drop every cached statement frame."""
+        with self._lock:
+            self._frames.clear()
+
+
+_simfin_store: Optional[SimFinStore] = None
+
+
+def get_simfin_store() -> SimFinStore:
+    """Get the process-wide SimFin store, creating it from the current config."""
+    global _simfin_store
+    config = get_config()
+    parquet_cache_dir = (
+        os.path.join(config["data_cache_dir"], "simfin")
+        if config.get("simfin_parquet_cache", False)
+        else None
+    )
+    if _simfin_store is None or _simfin_store.parquet_cache_dir != parquet_cache_dir:
+        _simfin_store = SimFinStore(parquet_cache_dir)
+    return _simfin_store
@@ -4,18 +4,13 @@ from stockstats import wrap
 from typing import Annotated
 import os
 from .config import get_config
+from .price_store import get_price_store
 
 
 class StockstatsUtils:
     @staticmethod
-    def get_stock_stats(
+    def get_stock_data(
         symbol: Annotated[str, "ticker symbol for the company"],
-        indicator: Annotated[
-            str, "quantitative indicators based off of the stock data for the company"
-        ],
-        curr_date: Annotated[
-            str, "curr date for retrieving stock price data, YYYY-mm-dd"
-        ],
         data_dir: Annotated[
             str,
             "directory where the stock data is stored.",
@@ -25,24 +20,16 @@ class StockstatsUtils:
             "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
         ] = False,
     ):
-        df = None
-        data = None
-
+        """Load the price history for a ticker and wrap it as a stockstats frame."""
         if not online:
             try:
-                data = pd.read_csv(
-                    os.path.join(
-                        data_dir,
-                        f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-                    )
-                )
+                data = get_price_store().load(symbol, data_dir)
                 df = wrap(data)
             except FileNotFoundError:
                 raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
         else:
             # Get today's date as YYYY-mm-dd to add to cache
             today_date = pd.Timestamp.today()
-            curr_date = pd.to_datetime(curr_date)
 
             end_date = today_date
             start_date = today_date - pd.DateOffset(years=15)
@@ -75,7 +62,30 @@ class StockstatsUtils:
 
             df = wrap(data)
             df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
-            curr_date = curr_date.strftime("%Y-%m-%d")
+
+        return df
+
+    @staticmethod
+    def get_stock_stats(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+        curr_date: Annotated[
+            str, "curr date for retrieving stock price data, YYYY-mm-dd"
+        ],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ):
+        df = StockstatsUtils.get_stock_data(symbol, data_dir, online=online)
+        if online:
+            curr_date = pd.to_datetime(curr_date).strftime("%Y-%m-%d")
 
         df[indicator]  # trigger stockstats to calculate the indicator
         matching_rows = df[df["Date"].str.startswith(curr_date)]
@@ -85,3 +95,68 @@ class StockstatsUtils:
             return indicator_value
         else:
             return "N/A: Not a trading day (weekend or holiday)"
+
+    @staticmethod
+    def get_stock_stats_window(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicator: Annotated[
+            str, "quantitative indicators based off of the stock data for the company"
+        ],
+        start_date: Annotated[str, "start date of the window, YYYY-mm-dd, inclusive"],
+        end_date: Annotated[str, "end date of the window, YYYY-mm-dd, inclusive"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> pd.Series:
+        """
+        Compute an indicator once over the full history and return its values for
+        every trading day in [start_date, end_date], indexed by YYYY-mm-dd date.
+        """
+        df = StockstatsUtils.get_stock_data(symbol, data_dir, online=online)
+
+        values = df[indicator].to_numpy()  # trigger stockstats to calculate the indicator
+        dates = df["Date"].astype(str).str[:10].to_numpy()
+        in_window = (dates >= start_date) & (dates <= end_date)
+
+        return pd.Series(values[in_window], index=dates[in_window], name=indicator)
+
+    @staticmethod
+    def get_indicators(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicators: Annotated[
+            list, "quantitative indicators based off of the stock data for the company"
+        ],
+        start_date: Annotated[str, "start date of the window, YYYY-mm-dd, inclusive"],
+        end_date: Annotated[str, "end date of the window, YYYY-mm-dd, inclusive"],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> pd.DataFrame:
+        """
+        Compute several indicators on one wrapped frame and return their values for
+        every trading day in [start_date, end_date], one column per indicator.
+
+        stockstats keeps derived columns on the frame, so indicators that share
+        intermediates (macd/macds/macdh, boll/boll_ub/boll_lb, ...) are only
+        computed once.
+        """
+        df = StockstatsUtils.get_stock_data(symbol, data_dir, online=online)
+
+        df[list(indicators)]  # trigger stockstats to calculate every indicator
+        dates = df["Date"].astype(str).str[:10].to_numpy()
+        in_window = (dates >= start_date) & (dates <= end_date)
+
+        return pd.DataFrame(
+            {indicator: df[indicator].to_numpy()[in_window] for indicator in indicators},
+            index=pd.Index(dates[in_window], name="Date"),
+        )
@@ -17,6 +17,39 @@ DEFAULT_CONFIG = {
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
     "max_recur_limit": 100,
+    # Run the analysts as concurrent branches instead of one after another
+    "parallel_analysts": False,
+    # Checkpoint the graph state after every node so failed runs can be resumed
+    "checkpointing": True,
+    # LLM response cache: "passthrough" (off), "record" (reuse and store responses)
+    # or "replay" (recorded responses only, a miss raises LLMCacheMissError)
+    "llm_cache_mode": "passthrough",
+    # Size limit of the recorded responses in bytes, least recently used are evicted
+    "llm_cache_max_bytes": 512 * 1024 * 1024,
+    # Final states are appended to {state_log_dir}/{ticker}/TradingAgentsStrategy_logs/full_states_log.jsonl
+    "state_log_dir": "eval_results",
+    # Number of recent final states kept in memory by the state logger
+    "state_log_max_retained": 32,
     # Tool settings
     "online_tools": True,
+    # Number of tickers the offline price store keeps loaded in memory
+    "price_store_max_tickers": 32,
+    # Number of parsed finnhub JSON files kept in memory
+    "finnhub_store_max_files": 64,
+    # Cache parsed SimFin statement files as Parquet (needs pyarrow or fastparquet)
+    "simfin_parquet_cache": False,
+    # Google News scraping: shared connection pool size and token-bucket rate limit
+    "google_news_pool_size": 4,
+    "google_news_requests_per_second": 0.25,
+    "google_news_burst": 2,
+    # Memory embedding backend: "openai" (OpenAI/Ollama endpoint) or "hashing" (local CPU, offline)
+    "embedding_backend": "openai",
+    "embedding_dimensions": 1024,
+    # Share embeddings of identical memory texts across memories and runs
+    "embedding_cache": True,
+    "embedding_cache_max_entries": 4096,
+    # Texts sent per embedding request when memories are added or queried in bulk
+    "embedding_batch_size": 64,
+    # Directory of the persistent agent memory store, None keeps memories in memory only
+    "memory_persist_dir": None,
 }
@@ -6,6 +6,8 @@ from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
 from .signal_processing import SignalProcessor
+from .state_logger import StateLogger
+from .llm_cache import LLMResponseCache, LLMCacheMissError, get_llm_cache
 
 __all__ = [
     "TradingAgentsGraph",
@@ -14,4 +16,8 @@ __all__ = [
     "Propagator",
     "Reflector",
     "SignalProcessor",
+    "StateLogger",
+    "LLMResponseCache",
+    "LLMCacheMissError",
+    "get_llm_cache",
 ]
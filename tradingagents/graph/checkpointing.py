@@ -0,0 +1,93 @@
+# TradingAgents/graph/checkpointing.py
+
+import hashlib
+import json
+import os
+import sqlite3
+from contextlib import asynccontextmanager
+from typing import Dict, List
+
+from langgraph.checkpoint.memory import InMemorySaver
+
+
+# Config keys that change the graph or its outputs; runs that differ in any of
+# them must not resume each other's checkpoints
+FINGERPRINT_CONFIG_KEYS = [
+    "llm_provider",
+    "deep_think_llm",
+    "quick_think_llm",
+    "parallel_analysts",
+    "max_debate_rounds",
+    "max_risk_discuss_rounds",
+    "online_tools",
+]
+
+
+def config_fingerprint(config: Dict, selected_analysts: List[str]) -> str:
+    """Short hash of the analysts and the config keys that shape a run."""
+    fingerprint = {key: config.get(key) for key in FINGERPRINT_CONFIG_KEYS}
+    fingerprint["selected_analysts"] = list(selected_analysts)
+    return hashlib.sha256(
+        json.dumps(fingerprint, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()[:12]
+
+
+def run_id_for(company_name: str, trade_date, fingerprint: str) -> str:
+    """Checkpoint thread id of the run for one company, trade date and config."""
+    return f"{company_name}:{trade_date}:{fingerprint}"
+
+
+def _checkpoint_db_path(config: Dict) -> str:
+    db_path = os.path.join(config["data_cache_dir"], "checkpoints.sqlite")
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    return db_path
+
+
+def create_checkpointer(config: Dict):
+    """
+    Create the checkpointer the graph is compiled with, or None if disabled.
+
+    Checkpoints are written to data_cache_dir/checkpoints.sqlite after every
+    completed node, so a failed run can be resumed where it stopped, also from
+    another process. Without the langgraph-checkpoint-sqlite package the
+    checkpoints are kept in memory and runs can only be resumed in-process.
+    """
+    if not config.get("checkpointing", True):
+        return None
+
+    try:
+        from langgraph.checkpoint.sqlite import SqliteSaver
+    except ImportError:
+        print(
+            "langgraph-checkpoint-sqlite is not installed, "
+            "graph checkpoints are kept in memory only"
+        )
+        return InMemorySaver()
+
+    db_path = _checkpoint_db_path(config)
+    # SqliteSaver serializes access with its own lock, so the connection can be
+    # shared by the runs of a batch
+    return SqliteSaver(sqlite3.connect(db_path, check_same_thread=False))
+
+
+@asynccontextmanager
+async def async_checkpointer(config: Dict, checkpointer):
+    """
+    Async counterpart of a checkpointer made by create_checkpointer.
+
+    SqliteSaver only implements the sync API, so async runs open an
+    AsyncSqliteSaver on the same database for as long as the context is
+    entered; it is bound to the running event loop. Runs checkpointed by
+    either saver can be resumed by the other. An in-memory saver supports
+    both APIs and is used as is.
+    """
+    if checkpointer is None or isinstance(checkpointer, InMemorySaver):
+        yield checkpointer
+        return
+
+    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+    async with AsyncSqliteSaver.from_conn_string(_checkpoint_db_path(config)) as saver:
+        # Create the tables up front, adelete_thread does not do it on its own
+        await saver.setup()
+        yield saver
@@ -0,0 +1,190 @@
+# TradingAgents/graph/llm_cache.py
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Sequence
+
+from langchain_core.caches import BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+
+
+LLM_CACHE_MODES = ("record", "replay", "passthrough")
+
+
+class LLMCacheMissError(LookupError):
+    """Raised in replay mode when a call has no recorded response."""
+
+
+class LLMResponseCache(BaseCache):
+    """
+    SQLite-backed LangChain cache of chat model responses.
+
+    Responses are keyed by a hash of the LLM string (model, parameters and bound
+    tools, as built by LangChain) and the serialized messages, so replaying a
+    graph run over the same inputs returns the recorded responses without
+    contacting the provider.
+
+    Modes:
+        record: serve hits from the cache and store the responses of misses
+        replay: serve hits from the cache and raise LLMCacheMissError on misses
+    When the stored responses exceed max_bytes, the least recently used ones are
+    evicted.
+    """
+
+    def __init__(self, db_path: str, mode: str = "record", max_bytes: int = None):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unsupported LLM cache mode: {mode}")
+        self.db_path = db_path
+        self.mode = mode
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                llm_string TEXT NOT NULL,
+                generations TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);
+            """
+        )
+        self._conn.commit()
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        return hashlib.sha256(f"{llm_string}\0{prompt}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _dumps(generations: Sequence[Generation]) -> str:
+        records = []
+        for generation in generations:
+            record = {
+                "text": generation.text,
+                "generation_info": generation.generation_info,
+            }
+            if isinstance(generation, ChatGeneration):
+                record["message"] = message_to_dict(generation.message)
+            records.append(record)
+        return json.dumps(records, ensure_ascii=False, default=str)
+
+    @staticmethod
+    def _loads(data: str) -> list:
+        generations = []
+        for record in json.loads(data):
+            if "message" in record:
+                generations.append(
+                    ChatGeneration(
+                        message=messages_from_dict([record["message"]])[0],
+                        generation_info=record["generation_info"],
+                    )
+                )
+            else:
+                generations.append(
+                    Generation(
+                        text=record["text"], generation_info=record["generation_info"]
+                    )
+                )
+        return generations
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[list]:
+        """Return the recorded generations for a call, or None on a miss."""
+        key = self._key(prompt, llm_string)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT generations FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                with self._conn:
+                    self._conn.execute(
+                        "UPDATE responses SET last_used = ? WHERE key = ?",
+                        (time.time(), key),
+                    )
+
+        if row is not None:
+            return self._loads(row[0])
+        if self.mode == "replay":
+            raise LLMCacheMissError(
+                f"No recorded LLM response for this call in {self.db_path}"
+            )
+        return None
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]):
+        """Record the generations of a call, evicting old responses if needed."""
+        if self.mode != "record":
+            return
+
+        key = self._key(prompt, llm_string)
+        data = self._dumps(return_val)
+        size = len(data.encode("utf-8"))
+        with self._lock, self._conn:
+            old = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, llm_string, generations, size, last_used) VALUES (?, ?, ?, ?, ?)",
+                (key, llm_string, data, size, time.time()),
+            )
+            self._total_bytes += size - (old[0] if old else 0)
+            self._evict()
+
+    def _evict(self):
+        """Drop least recently used responses until the cache fits max_bytes."""
+        if not self.max_bytes:
+            return
+        while self._total_bytes > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY last_used LIMIT 64"
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                return
+            evicted = []
+            for key, size in rows:
+                if self._total_bytes <= self.max_bytes:
+                    break
+                evicted.append((key,))
+                self._total_bytes -= size
+            self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def clear(self, **kwargs: Any):
+        """Drop every recorded response."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+            self._total_bytes = 0
+
+
+_llm_caches: Dict[tuple, LLMResponseCache] = {}
+_llm_caches_lock = threading.Lock()
+
+
+def get_llm_cache(config: Dict) -> Optional[LLMResponseCache]:
+    """Get the LLM response cache selected by the config, or None in passthrough mode."""
+    mode = config.get("llm_cache_mode", "passthrough")
+    if mode not in LLM_CACHE_MODES:
+        raise ValueError(f"Unsupported LLM cache mode: {mode}")
+    if mode == "passthrough":
+        return None
+
+    db_path = os.path.join(config["data_cache_dir"], "llm_cache.sqlite")
+    with _llm_caches_lock:
+        cache = _llm_caches.get((db_path, mode))
+        if cache is None:
+            cache = LLMResponseCache(
+                db_path, mode=mode, max_bytes=config.get("llm_cache_max_bytes")
+            )
+            _llm_caches[(db_path, mode)] = cache
+        return cache
@@ -1,9 +1,25 @@
 # TradingAgents/graph/reflection.py
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 from langchain_openai import ChatOpenAI
 
 
+# Component name -> (label used in the reflection, report it reflects on)
+REFLECTION_COMPONENTS = {
+    "bull": ("BULL", lambda state: state["investment_debate_state"]["bull_history"]),
+    "bear": ("BEAR", lambda state: state["investment_debate_state"]["bear_history"]),
+    "trader": ("TRADER", lambda state: state["trader_investment_plan"]),
+    "invest_judge": (
+        "INVEST JUDGE",
+        lambda state: state["investment_debate_state"]["judge_decision"],
+    ),
+    "risk_manager": (
+        "RISK JUDGE",
+        lambda state: state["risk_debate_state"]["judge_decision"],
+    ),
+}
+
+
 class Reflector:
     """Handles reflection on decisions and updating memory."""
 
@@ -55,11 +71,9 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
 
         return f"{curr_market_report}\n\n{curr_sentiment_report}\n\n{curr_news_report}\n\n{curr_fundamentals_report}"
 
-    def _reflect_on_component(
-        self, component_type: str, report: str, situation: str, returns_losses
-    ) -> str:
-        """Generate reflection for a component."""
-        messages = [
+    def _build_messages(self, report: str, situation: str, returns_losses) -> list:
+        """Build the reflection prompt for one component's report."""
+        return [
             ("system", self.reflection_system_prompt),
             (
                 "human",
@@ -67,55 +81,71 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
             ),
         ]
 
-        result = self.quick_thinking_llm.invoke(messages).content
-        return result
+    def reflect_many(
+        self,
+        items: List[Tuple[Dict[str, Any], Any]],
+        memories: Dict[str, Any],
+        max_concurrency: int = None,
+    ):
+        """Reflect on several runs and update memory in one pass.
+
+        items: list of (final state, returns_losses) pairs
+        memories: component name (a key of REFLECTION_COMPONENTS) -> memory
+
+        The situation of each state is extracted once, every reflection is sent
+        to the LLM concurrently as a single batch, and each memory receives all
+        of its new trade memories in one add_trade_memories call.
+        """
+        jobs = []
+        for current_state, returns_losses in items:
+            situation = self._extract_current_situation(current_state)
+            for name in memories:
+                _, get_report = REFLECTION_COMPONENTS[name]
+                messages = self._build_messages(
+                    get_report(current_state), situation, returns_losses
+                )
+                jobs.append((name, current_state, returns_losses, messages))
+
+        if not jobs:
+            return
+
+        config = {"max_concurrency": max_concurrency} if max_concurrency else None
+        results = self.quick_thinking_llm.batch(
+            [messages for _, _, _, messages in jobs], config=config
+        )
+
+        new_trades = {name: [] for name in memories}
+        for (name, current_state, returns_losses, _), result in zip(jobs, results):
+            trade_outcome = {"outcome": str(returns_losses), "lesson": result.content}
+            new_trades[name].append((current_state, trade_outcome))
+
+        for name, trades in new_trades.items():
+            memories[name].add_trade_memories(trades)
+
+    def reflect_all(self, current_state, returns_losses, memories, max_concurrency=None):
+        """Reflect on every component of one run concurrently and update memory."""
+        self.reflect_many([(current_state, returns_losses)], memories, max_concurrency)
 
     def reflect_bull_researcher(self, current_state, returns_losses, bull_memory):
         """Reflect on bull researcher's analysis and update memory."""
-        situation = self._extract_current_situation(current_state)
-        bull_debate_history = current_state["investment_debate_state"]["bull_history"]
-
-        result = self._reflect_on_component(
-            "BULL", bull_debate_history, situation, returns_losses
-        )
-        bull_memory.add_situations([(situation, result)])
+        self.reflect_all(current_state, returns_losses, {"bull": bull_memory})
 
     def reflect_bear_researcher(self, current_state, returns_losses, bear_memory):
         """Reflect on bear researcher's analysis and update memory."""
-        situation = self._extract_current_situation(current_state)
-        bear_debate_history = current_state["investment_debate_state"]["bear_history"]
-
-        result = self._reflect_on_component(
-            "BEAR", bear_debate_history, situation, returns_losses
-        )
-        bear_memory.add_situations([(situation, result)])
+        self.reflect_all(current_state, returns_losses, {"bear": bear_memory})
 
     def reflect_trader(self, current_state, returns_losses, trader_memory):
         """Reflect on trader's decision and update memory."""
-        situation = self._extract_current_situation(current_state)
-        trader_decision = current_state["trader_investment_plan"]
-
-        result = self._reflect_on_component(
-            "TRADER", trader_decision, situation, returns_losses
-        )
-        trader_memory.add_situations([(situation, result)])
+        self.reflect_all(current_state, returns_losses, {"trader": trader_memory})
 
     def reflect_invest_judge(self, current_state, returns_losses, invest_judge_memory):
         """Reflect on investment judge's decision and update memory."""
-        situation = self._extract_current_situation(current_state)
-        judge_decision = current_state["investment_debate_state"]["judge_decision"]
-
-        result = self._reflect_on_component(
-            "INVEST JUDGE", judge_decision, situation, returns_losses
+        self.reflect_all(
+            current_state, returns_losses, {"invest_judge": invest_judge_memory}
         )
-        invest_judge_memory.add_situations([(situation, result)])
 
     def reflect_risk_manager(self, current_state, returns_losses, risk_manager_memory):
         """Reflect on risk manager's decision and update memory."""
-        situation = self._extract_current_situation(current_state)
-        judge_decision = current_state["risk_debate_state"]["judge_decision"]
-
-        result = self._reflect_on_component(
-            "RISK JUDGE", judge_decision, situation, returns_losses
+        self.reflect_all(
+            current_state, returns_losses, {"risk_manager": risk_manager_memory}
         )
-        risk_manager_memory.add_situations([(situation, result)])
@@ -1,26 +1,120 @@
 # TradingAgents/graph/signal_processing.py
 
+import json
+import re
+import threading
+from typing import Any, Dict, Optional
+
 from langchain_openai import ChatOpenAI
 
 
+DECISIONS = ("BUY", "SELL", "HOLD")
+
+# Chinese action words that may appear as JSON values
+_ACTION_ALIASES = {"买入": "BUY", "卖出": "SELL", "持有": "HOLD", "观望": "HOLD"}
+
+_FENCED_JSON_PATTERN = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+_PROPOSAL_PATTERN = re.compile(
+    r"FINAL TRANSACTION PROPOSAL:\s*\**\s*(BUY|SELL|HOLD)\b", re.IGNORECASE
+)
+
+
+def _parse_json_object(text: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Parse a JSON object from an LLM reply, bare or inside a ```json fence."""
+    if not text:
+        return None
+
+    candidates = [text.strip()]
+    candidates.extend(_FENCED_JSON_PATTERN.findall(text))
+    start, end = text.find("{"), text.rfind("}")
+    if 0 <= start < end:
+        candidates.append(text[start : end + 1])
+
+    for candidate in candidates:
+        try:
+            parsed = json.loads(candidate)
+        except ValueError:
+            continue
+        if isinstance(parsed, dict):
+            return parsed
+    return None
+
+
+def _normalize_action(value: Any) -> Optional[str]:
+    """Map an action value to BUY/SELL/HOLD, or None if it is not one."""
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    if value.upper() in DECISIONS:
+        return value.upper()
+    return _ACTION_ALIASES.get(value)
+
+
 class SignalProcessor:
     """Processes trading signals to extract actionable decisions."""
 
     def __init__(self, quick_thinking_llm: ChatOpenAI):
         """Initialize with an LLM for processing."""
         self.quick_thinking_llm = quick_thinking_llm
+        self._stats = {"parsed": 0, "llm_fallback": 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, key: str):
+        with self._stats_lock:
+            self._stats[key] += 1
 
-    def process_signal(self, full_signal: str) -> str:
+    def get_stats(self) -> Dict[str, int]:
+        """How many signals were parsed by rules and how many needed the LLM."""
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def extract_decision(
+        self, full_signal: str, trade_instruction: str = None
+    ) -> Optional[str]:
         """
-        Process a full trading signal to extract the core decision.
+        Extract the decision without an LLM call.
 
         Args:
-            full_signal: Complete trading signal text
+            full_signal: Final trade decision, usually the risk manager's JSON
+                RiskAssessment
+            trade_instruction: The trader's JSON TradeInstruction, if available
 
         Returns:
-            Extracted decision (BUY, SELL, or HOLD)
+            BUY, SELL or HOLD, or None when the signal is ambiguous
         """
-        messages = [
+        signal = _parse_json_object(full_signal)
+        if signal is not None:
+            for key in ("action", "decision"):
+                action = _normalize_action(signal.get(key))
+                if action:
+                    return action
+
+            # A risk assessment approves or vetoes the trader's instruction
+            approval = signal.get("approval")
+            instruction = _parse_json_object(trade_instruction)
+            action = _normalize_action(instruction.get("action")) if instruction else None
+            if isinstance(approval, str) and action:
+                approval = approval.strip().upper()
+                if approval == "YES":
+                    return action
+                if approval == "NO":
+                    return "HOLD"
+            if "approval" in signal:
+                # Without the trader's action the assessment alone is ambiguous
+                return None
+
+        if not full_signal:
+            return None
+
+        match = _PROPOSAL_PATTERN.search(full_signal)
+        if match:
+            return match.group(1).upper()
+
+        # Free text is left to the LLM, a bare keyword may be negated
+        return None
+
+    def _build_messages(self, full_signal: str):
+        return [
             (
                 "system",
                 "You are an efficient assistant designed to analyze paragraphs or financial reports provided by a group of analysts. Your task is to extract the investment decision: SELL, BUY, or HOLD. Provide only the extracted decision (SELL, BUY, or HOLD) as your output, without adding any additional text or information.",
@@ -28,4 +122,40 @@ class SignalProcessor:
             ("human", full_signal),
         ]
 
+    def process_signal(self, full_signal: str, trade_instruction: str = None) -> str:
+        """
+        Process a full trading signal to extract the core decision.
+
+        The structured JSON and keyword markers are parsed first; the LLM is
+        only asked when they do not determine the decision.
+
+        Args:
+            full_signal: Complete trading signal text
+            trade_instruction: The trader's JSON TradeInstruction, if available
+
+        Returns:
+            Extracted decision (BUY, SELL, or HOLD)
+        """
+        decision = self.extract_decision(full_signal, trade_instruction)
+        if decision is not None:
+            self._count("parsed")
+            return decision
+
+        self._count("llm_fallback")
+        messages = self._build_messages(full_signal)
+
         return self.quick_thinking_llm.invoke(messages).content
+
+    async def aprocess_signal(
+        self, full_signal: str, trade_instruction: str = None
+    ) -> str:
+        """Async version of process_signal."""
+        decision = self.extract_decision(full_signal, trade_instruction)
+        if decision is not None:
+            self._count("parsed")
+            return decision
+
+        self._count("llm_fallback")
+        messages = self._build_messages(full_signal)
+
+        return (await self.quick_thinking_llm.ainvoke(messages)).content
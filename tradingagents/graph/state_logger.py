@@ -0,0 +1,142 @@
+# TradingAgents/graph/state_logger.py
+
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class StateLogger:
+    """
+    Append-only log of final graph states, written on a background thread.
+
+    Every run becomes one JSON line in {log_dir}/{ticker}/TradingAgentsStrategy_logs/
+    full_states_log.jsonl, so logging a run costs the same however many runs
+    came before it. Runs are queued and written in batches by a single writer
+    thread; when the bounded queue is full, log() blocks until the writer
+    catches up. Only the most recent max_retained states are kept in memory.
+    Call close() when done; loggers still open at exit are closed then.
+    """
+
+    def __init__(
+        self,
+        log_dir: str = "eval_results",
+        max_retained: int = 32,
+        queue_size: int = 256,
+    ):
+        self.log_dir = log_dir
+        self.max_retained = max_retained
+        self.recent: "OrderedDict[tuple, Dict]" = OrderedDict()
+        self._recent_lock = threading.Lock()
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=queue_size)
+        self._closed = False
+
+        self._writer = threading.Thread(
+            target=self._write_loop, name="state-logger", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
+
+    def log_path(self, ticker: str) -> str:
+        """Path of the JSONL state log of a ticker."""
+        return os.path.join(
+            self.log_dir, ticker, "TradingAgentsStrategy_logs", "full_states_log.jsonl"
+        )
+
+    def log(self, ticker: str, trade_date, state: Dict[str, Any]):
+        """Queue the final state of one run to be appended to the ticker's log."""
+        if self._closed:
+            raise RuntimeError("State logger is closed")
+        trade_date = str(trade_date)
+        with self._recent_lock:
+            self.recent[(ticker, trade_date)] = state
+            self.recent.move_to_end((ticker, trade_date))
+            while len(self.recent) > self.max_retained:
+                self.recent.popitem(last=False)
+        self._queue.put((ticker, trade_date, state))
+
+    def _write_loop(self):
+        while True:
+            batch = [self._queue.get()]
+            # Drain whatever else is waiting so it is written with one flush
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._write_batch([item for item in batch if item is not None])
+            except Exception as e:
+                print(f"Failed to write state log: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+            if None in batch:
+                return
+
+    def _write_batch(self, batch):
+        lines_by_ticker: Dict[str, list] = {}
+        for ticker, trade_date, state in batch:
+            record = {"trade_date": trade_date, "logged_at": time.time(), "state": state}
+            lines_by_ticker.setdefault(ticker, []).append(
+                json.dumps(record, ensure_ascii=False, default=str) + "\n"
+            )
+
+        for ticker, lines in lines_by_ticker.items():
+            path = self.log_path(ticker)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "a", encoding="utf-8") as f:
+                f.writelines(lines)
+
+    def flush(self):
+        """Block until every queued state has been written."""
+        self._queue.join()
+
+    def close(self):
+        """Write the remaining states and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._writer.join()
+        # Release the exit hook so a closed logger can be garbage collected
+        atexit.unregister(self.close)
+
+    def read(
+        self,
+        ticker: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Dict[str, Dict]:
+        """
+        Load logged states of a ticker back, keyed by trade date.
+
+        Only dates within [start_date, end_date] (yyyy-mm-dd, both optional)
+        are returned. When a date was logged more than once, the latest run wins.
+        """
+        if not self._closed:
+            self.flush()
+
+        path = self.log_path(ticker)
+        if not os.path.exists(path):
+            return {}
+
+        states = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                trade_date = record["trade_date"]
+                if start_date and trade_date < start_date:
+                    continue
+                if end_date and trade_date > end_date:
+                    continue
+                states[trade_date] = record["state"]
+        return dict(sorted(states.items()))
@@ -1,8 +1,9 @@
 # TradingAgents/graph/trading_graph.py
 
 import os
-from pathlib import Path
-import json
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import asynccontextmanager
 from datetime import date
 from typing import Dict, Any, Tuple, List, Optional
 
@@ -10,11 +11,13 @@ from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
 from langchain_google_genai import ChatGoogleGenerativeAI
 
+from langchain_core.messages import AIMessageChunk, RemoveMessage
+
 from langgraph.prebuilt import ToolNode
 
 from tradingagents.agents import *
 from tradingagents.default_config import DEFAULT_CONFIG
-from tradingagents.agents.utils.memory import FinancialSituationMemory
+from tradingagents.agents.utils.memory import AshareMemoryManager
 from tradingagents.agents.utils.agent_states import (
     AgentState,
     InvestDebateState,
@@ -22,11 +25,79 @@ from tradingagents.agents.utils.agent_states import (
 )
 from tradingagents.dataflows.interface import set_config
 
+from .checkpointing import (
+    async_checkpointer,
+    config_fingerprint,
+    create_checkpointer,
+    run_id_for,
+)
 from .conditional_logic import ConditionalLogic
+from .llm_cache import get_llm_cache
 from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
 from .signal_processing import SignalProcessor
+from .state_logger import StateLogger
+
+
+def _content_text(content):
+    """Text of a message content, which may be a list of content blocks."""
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block.get("text", "") if isinstance(block, dict) else str(block)
+        for block in content
+    )
+
+
+def _stream_events(namespace, mode, payload):
+    """Translate one chunk of a ["updates", "messages", "values"] stream into
+    the (kind, node, payload) events of TradingAgentsGraph.stream_run."""
+    if mode == "values":
+        if not namespace:
+            yield "values", None, payload
+    elif mode == "messages":
+        chunk, metadata = payload
+        if isinstance(chunk, AIMessageChunk) and chunk.content:
+            yield "token", metadata.get("langgraph_node"), chunk.content
+    else:
+        for node, delta in payload.items():
+            if isinstance(delta, dict):
+                yield "update", node, delta
+
+
+class _DebugPrinter:
+    """Prints LLM replies as they are generated and the other messages each node adds."""
+
+    def __init__(self):
+        self.printing_node = None
+        self.streamed_nodes = set()
+
+    def __call__(self, kind, node, payload):
+        if kind == "token":
+            if node != self.printing_node:
+                print(f"\n[{node}] ", end="")
+                self.printing_node = node
+            print(_content_text(payload), end="", flush=True)
+            self.streamed_nodes.add(node)
+        elif kind == "update":
+            if self.printing_node is not None:
+                print()
+                self.printing_node = None
+            for message in payload.get("messages", []):
+                if isinstance(message, RemoveMessage) or not hasattr(
+                    message, "pretty_print"
+                ):
+                    continue
+                # Replies already printed token by token are not repeated
+                if (
+                    node in self.streamed_nodes
+                    and message.type == "ai"
+                    and not message.tool_calls
+                ):
+                    continue
+                message.pretty_print()
+            self.streamed_nodes.discard(node)
 
 
 class TradingAgentsGraph:
@@ -57,27 +128,32 @@ class TradingAgentsGraph:
             exist_ok=True,
         )
 
-        # Initialize LLMs
+        # Initialize LLMs, sharing the response cache when one is configured
+        llm_kwargs = {}
+        self.llm_cache = get_llm_cache(self.config)
+        if self.llm_cache is not None:
+            llm_kwargs["cache"] = self.llm_cache
+
         if self.config["llm_provider"].lower() == "openai" or self.config["llm_provider"] == "ollama" or self.config["llm_provider"] == "openrouter":
-            self.deep_thinking_llm = ChatOpenAI(model=self.config["deep_think_llm"], base_url=self.config["backend_url"])
-            self.quick_thinking_llm = ChatOpenAI(model=self.config["quick_think_llm"], base_url=self.config["backend_url"])
+            self.deep_thinking_llm = ChatOpenAI(model=self.config["deep_think_llm"], base_url=self.config["backend_url"], **llm_kwargs)
+            self.quick_thinking_llm = ChatOpenAI(model=self.config["quick_think_llm"], base_url=self.config["backend_url"], **llm_kwargs)
         elif self.config["llm_provider"].lower() == "anthropic":
-            self.deep_thinking_llm = ChatAnthropic(model=self.config["deep_think_llm"], base_url=self.config["backend_url"])
-            self.quick_thinking_llm = ChatAnthropic(model=self.config["quick_think_llm"], base_url=self.config["backend_url"])
+            self.deep_thinking_llm = ChatAnthropic(model=self.config["deep_think_llm"], base_url=self.config["backend_url"], **llm_kwargs)
+            self.quick_thinking_llm = ChatAnthropic(model=self.config["quick_think_llm"], base_url=self.config["backend_url"], **llm_kwargs)
         elif self.config["llm_provider"].lower() == "google":
-            self.deep_thinking_llm = ChatGoogleGenerativeAI(model=self.config["deep_think_llm"])
-            self.quick_thinking_llm = ChatGoogleGenerativeAI(model=self.config["quick_think_llm"])
+            self.deep_thinking_llm = ChatGoogleGenerativeAI(model=self.config["deep_think_llm"], **llm_kwargs)
+            self.quick_thinking_llm = ChatGoogleGenerativeAI(model=self.config["quick_think_llm"], **llm_kwargs)
         else:
             raise ValueError(f"Unsupported LLM provider: {self.config['llm_provider']}")
         
         self.toolkit = Toolkit(config=self.config)
 
         # Initialize memories
-        self.bull_memory = FinancialSituationMemory("bull_memory", self.config)
-        self.bear_memory = FinancialSituationMemory("bear_memory", self.config)
-        self.trader_memory = FinancialSituationMemory("trader_memory", self.config)
-        self.invest_judge_memory = FinancialSituationMemory("invest_judge_memory", self.config)
-        self.risk_manager_memory = FinancialSituationMemory("risk_manager_memory", self.config)
+        self.bull_memory = AshareMemoryManager("bull_memory", self.config)
+        self.bear_memory = AshareMemoryManager("bear_memory", self.config)
+        self.trader_memory = AshareMemoryManager("trader_memory", self.config)
+        self.invest_judge_memory = AshareMemoryManager("invest_judge_memory", self.config)
+        self.risk_manager_memory = AshareMemoryManager("risk_manager_memory", self.config)
 
         # Create tool nodes
         self.tool_nodes = self._create_tool_nodes()
@@ -103,11 +179,35 @@ class TradingAgentsGraph:
 
         # State tracking
         self.curr_state = None
+        self.curr_run_id = None
         self.ticker = None
-        self.log_states_dict = {}  # date to full state dict
+        # Appends final states to per-ticker JSONL logs on a background thread
+        self.state_logger = StateLogger(
+            log_dir=self.config.get("state_log_dir", "eval_results"),
+            max_retained=self.config.get("state_log_max_retained", 32),
+        )
+
+        # Set up the graph, checkpointing the state after every node
+        self.selected_analysts = selected_analysts
+        self.config_fingerprint = config_fingerprint(self.config, selected_analysts)
+        self.checkpointer = create_checkpointer(self.config)
+        self.graph = self.graph_setup.setup_graph(
+            selected_analysts,
+            parallel_analysts=self.config.get("parallel_analysts", False),
+            checkpointer=self.checkpointer,
+        )
+        # Async graph for apropagate, compiled on first use
+        self.async_graph = None
 
-        # Set up the graph
-        self.graph = self.graph_setup.setup_graph(selected_analysts)
+    def close(self):
+        """Write the queued state logs and stop the state logger's writer thread."""
+        self.state_logger.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
     def _create_tool_nodes(self) -> Dict[str, ToolNode]:
         """Create tool nodes for different data sources."""
@@ -117,9 +217,11 @@ class TradingAgentsGraph:
                     # online tools
                     self.toolkit.get_YFin_data_online,
                     self.toolkit.get_stockstats_indicators_report_online,
+                    self.toolkit.get_stockstats_indicators_batch_report_online,
                     # offline tools
                     self.toolkit.get_YFin_data,
                     self.toolkit.get_stockstats_indicators_report,
+                    self.toolkit.get_stockstats_indicators_batch_report,
                 ]
             ),
             "social": ToolNode(
@@ -154,31 +256,300 @@ class TradingAgentsGraph:
             ),
         }
 
-    def propagate(self, company_name, trade_date):
-        """Run the trading agents graph for a company on a specific date."""
+    def get_run_id(self, company_name, trade_date):
+        """Id under which the run for a company and date is checkpointed.
 
-        self.ticker = company_name
+        The id includes a fingerprint of the analysts, models and debate
+        settings, so a run never resumes a checkpoint made with another setup.
+        """
+        return run_id_for(company_name, trade_date, self.config_fingerprint)
+
+    def prepare_run(self, company_name, trade_date, resume=False):
+        """Build the graph input and invocation arguments of a run.
 
-        # Initialize state
+        With checkpointing enabled the run is bound to its checkpoint thread.
+        If resume is True and the run already finished, its final state is
+        returned as the third element; if it was interrupted, the input is None
+        so the graph continues from the last completed node. Otherwise any old
+        checkpoints of the run are dropped and it starts over.
+
+        Returns:
+            (graph input, graph arguments, final state or None)
+        """
         init_agent_state = self.propagator.create_initial_state(
             company_name, trade_date
         )
         args = self.propagator.get_graph_args()
 
+        if self.checkpointer is None:
+            return init_agent_state, args, None
+
+        run_id = self.get_run_id(company_name, trade_date)
+        args["config"]["configurable"] = {"thread_id": run_id}
+        snapshot = self.graph.get_state(args["config"]) if resume else None
+        if snapshot is not None and snapshot.values:
+            if not snapshot.next:
+                # The run already finished
+                return None, args, snapshot.values
+            # Passing no input continues from the last checkpoint
+            return None, args, None
+
+        self.checkpointer.delete_thread(run_id)
+        return init_agent_state, args, None
+
+    def stream_run(self, company_name, trade_date, resume=False):
+        """Run the graph for one company and date, yielding progress as it happens.
+
+        Instead of the whole state after every step, only node-level deltas and
+        LLM tokens are streamed, so the work per event is proportional to what
+        changed. Yields (kind, node, payload) tuples:
+            ("token", node, content): a piece of an LLM reply being generated
+            ("update", node, delta): the state update a node returned, including
+                the nodes inside the analyst branch subgraphs
+            ("final", None, final_state): the final state, always yielded last
+        """
+        init_agent_state, args, final_state = self.prepare_run(
+            company_name, trade_date, resume=resume
+        )
+        if final_state is not None:
+            yield "final", None, final_state
+            return
+
+        # The full state ("values") is only kept as the latest final state
+        # candidate, it is not inspected per step
+        args["stream_mode"] = ["updates", "messages", "values"]
+        for chunk in self.graph.stream(init_agent_state, subgraphs=True, **args):
+            for kind, node, payload in _stream_events(*chunk):
+                if kind == "values":
+                    final_state = payload
+                else:
+                    yield kind, node, payload
+
+        yield "final", None, final_state
+
+    def _run_graph(self, company_name, trade_date, resume=False):
+        """Run the graph for one company and date and return the final state.
+
+        This touches no per-run attributes of the instance, so several runs may
+        share it concurrently.
+        """
         if self.debug:
-            # Debug mode with tracing
-            trace = []
-            for chunk in self.graph.stream(init_agent_state, **args):
-                if len(chunk["messages"]) == 0:
-                    pass
+            # Debug mode with tracing: print LLM replies as they are generated
+            # and the other messages each node adds
+            print_event = _DebugPrinter()
+            for kind, node, payload in self.stream_run(
+                company_name, trade_date, resume=resume
+            ):
+                if kind == "final":
+                    return payload
+                print_event(kind, node, payload)
+
+        init_agent_state, args, final_state = self.prepare_run(
+            company_name, trade_date, resume=resume
+        )
+        if final_state is not None:
+            return final_state
+
+        # Standard mode without tracing
+        return self.graph.invoke(init_agent_state, **args)
+
+    def propagate(self, company_name, trade_date, resume=False):
+        """Run the trading agents graph for a company on a specific date.
+
+        If the run fails, self.curr_run_id names its checkpoint for resume().
+        """
+
+        self.ticker = company_name
+        self.curr_run_id = self.get_run_id(company_name, trade_date)
+
+        final_state = self._run_graph(company_name, trade_date, resume=resume)
+
+        # Store current state for reflection
+        self.curr_state = final_state
+
+        # Log state
+        self._log_state(trade_date, final_state)
+
+        # Return decision and processed signal
+        return final_state, self.process_signal(
+            final_state["final_trade_decision"],
+            final_state.get("trader_investment_plan"),
+        )
+
+    def resume(self, run_id):
+        """Continue a checkpointed run from its last completed node.
+
+        Returns the same (final_state, decision) pair as propagate; a run that
+        already finished is returned without calling any agent again.
+        """
+        if self.checkpointer is None:
+            raise ValueError("Resuming a run requires checkpointing to be enabled")
+
+        snapshot = self.graph.get_state({"configurable": {"thread_id": run_id}})
+        if not snapshot.values:
+            raise ValueError(f"No checkpointed run found for {run_id}")
+
+        return self.propagate(
+            snapshot.values["company_of_interest"],
+            snapshot.values["trade_date"],
+            resume=True,
+        )
+
+    def _propagate_isolated(self, company_name, trade_date, resume=False):
+        """Run one pair of a batch, logging its state to its own file."""
+        final_state = self._run_graph(company_name, trade_date, resume=resume)
+        self.state_logger.log(
+            company_name, trade_date, self._state_log_entry(final_state)
+        )
+        return final_state, self.process_signal(
+            final_state["final_trade_decision"],
+            final_state.get("trader_investment_plan"),
+        )
+
+    def propagate_many(self, pairs, max_concurrency=4, resume=True):
+        """Run the graph for many (company, trade date) pairs concurrently.
+
+        All runs share this instance's LLM clients, memories, data caches and
+        compiled graph, while at most max_concurrency of them are in flight.
+        Each run keeps its own state: curr_state and ticker are left untouched
+        and every run is appended to its ticker's state log.
+
+        With checkpointing enabled and resume=True, pairs that already finished
+        are not run again and interrupted ones continue from their checkpoint,
+        so a sweep that stopped part way can simply be started again.
+
+        Duplicate pairs share one checkpoint, so each is run only once.
+
+        Yields one dict per pair as soon as it completes, with the keys
+        "ticker", "trade_date", "final_state", "decision" and "error" (the
+        exception if the run failed, None otherwise).
+        """
+        pairs = list(dict.fromkeys((ticker, trade_date) for ticker, trade_date in pairs))
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        try:
+            futures = {
+                executor.submit(
+                    self._propagate_isolated, ticker, trade_date, resume
+                ): (
+                    ticker,
+                    trade_date,
+                )
+                for ticker, trade_date in pairs
+            }
+            for future in as_completed(futures):
+                ticker, trade_date = futures[future]
+                result = {
+                    "ticker": ticker,
+                    "trade_date": trade_date,
+                    "final_state": None,
+                    "decision": None,
+                    "error": None,
+                }
+                try:
+                    result["final_state"], result["decision"] = future.result()
+                except Exception as e:
+                    result["error"] = e
+                yield result
+        finally:
+            # drop runs that have not started if the caller stops early
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_async_graph(self):
+        """Compile the graph built from async nodes on first use."""
+        if self.async_graph is None:
+            self.async_graph = self.graph_setup.setup_graph(
+                self.selected_analysts,
+                parallel_analysts=self.config.get("parallel_analysts", False),
+                use_async=True,
+            )
+        return self.async_graph
+
+    @asynccontextmanager
+    async def _async_session(self):
+        """Async graph bound to a checkpointer that works on the running event loop."""
+        graph = self._get_async_graph()
+        async with async_checkpointer(self.config, self.checkpointer) as saver:
+            if saver is not None:
+                graph = graph.copy(update={"checkpointer": saver})
+            yield graph
+
+    async def _aprepare_run(self, graph, company_name, trade_date, resume=False):
+        """Async version of prepare_run for a graph from _async_session."""
+        init_agent_state = self.propagator.create_initial_state(
+            company_name, trade_date
+        )
+        args = self.propagator.get_graph_args()
+
+        if graph.checkpointer is None:
+            return init_agent_state, args, None
+
+        run_id = self.get_run_id(company_name, trade_date)
+        args["config"]["configurable"] = {"thread_id": run_id}
+        snapshot = await graph.aget_state(args["config"]) if resume else None
+        if snapshot is not None and snapshot.values:
+            if not snapshot.next:
+                # The run already finished
+                return None, args, snapshot.values
+            # Passing no input continues from the last checkpoint
+            return None, args, None
+
+        await graph.checkpointer.adelete_thread(run_id)
+        return init_agent_state, args, None
+
+    async def _astream_run(self, graph, company_name, trade_date, resume=False):
+        """Async version of stream_run on the given async graph."""
+        init_agent_state, args, final_state = await self._aprepare_run(
+            graph, company_name, trade_date, resume=resume
+        )
+        if final_state is not None:
+            yield "final", None, final_state
+            return
+
+        args["stream_mode"] = ["updates", "messages", "values"]
+        async for chunk in graph.astream(init_agent_state, subgraphs=True, **args):
+            for kind, node, payload in _stream_events(*chunk):
+                if kind == "values":
+                    final_state = payload
                 else:
-                    chunk["messages"][-1].pretty_print()
-                    trace.append(chunk)
+                    yield kind, node, payload
 
-            final_state = trace[-1]
-        else:
-            # Standard mode without tracing
-            final_state = self.graph.invoke(init_agent_state, **args)
+        yield "final", None, final_state
+
+    async def _arun_graph(self, graph, company_name, trade_date, resume=False):
+        """Async version of _run_graph."""
+        if self.debug:
+            # Debug mode with tracing, printed the same way as by _run_graph
+            print_event = _DebugPrinter()
+            async for kind, node, payload in self._astream_run(
+                graph, company_name, trade_date, resume=resume
+            ):
+                if kind == "final":
+                    return payload
+                print_event(kind, node, payload)
+
+        init_agent_state, args, final_state = await self._aprepare_run(
+            graph, company_name, trade_date, resume=resume
+        )
+        if final_state is not None:
+            return final_state
+
+        # Standard mode without tracing
+        return await graph.ainvoke(init_agent_state, **args)
+
+    async def apropagate(self, company_name, trade_date, resume=False):
+        """Async version of propagate.
+
+        Agent nodes await their LLM calls and tools run off the event loop, so
+        many analyses can be driven concurrently from one event loop. Runs are
+        checkpointed like the sync ones and can be resumed from either path.
+        """
+        self.ticker = company_name
+        self.curr_run_id = self.get_run_id(company_name, trade_date)
+
+        async with self._async_session() as graph:
+            final_state = await self._arun_graph(
+                graph, company_name, trade_date, resume=resume
+            )
 
         # Store current state for reflection
         self.curr_state = final_state
@@ -187,11 +558,58 @@ class TradingAgentsGraph:
         self._log_state(trade_date, final_state)
 
         # Return decision and processed signal
-        return final_state, self.process_signal(final_state["final_trade_decision"])
+        return final_state, await self.signal_processor.aprocess_signal(
+            final_state["final_trade_decision"],
+            final_state.get("trader_investment_plan"),
+        )
 
-    def _log_state(self, trade_date, final_state):
-        """Log the final state to a JSON file."""
-        self.log_states_dict[str(trade_date)] = {
+    async def apropagate_many(self, pairs, max_concurrency=4, resume=True):
+        """Async version of propagate_many, running every pair on one event loop."""
+        pairs = list(dict.fromkeys((ticker, trade_date) for ticker, trade_date in pairs))
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(graph, ticker, trade_date):
+            result = {
+                "ticker": ticker,
+                "trade_date": trade_date,
+                "final_state": None,
+                "decision": None,
+                "error": None,
+            }
+            async with semaphore:
+                try:
+                    final_state = await self._arun_graph(
+                        graph, ticker, trade_date, resume=resume
+                    )
+                    self.state_logger.log(
+                        ticker, trade_date, self._state_log_entry(final_state)
+                    )
+                    result["final_state"] = final_state
+                    result["decision"] = await self.signal_processor.aprocess_signal(
+                        final_state["final_trade_decision"],
+                        final_state.get("trader_investment_plan"),
+                    )
+                except Exception as e:
+                    result["error"] = e
+            return result
+
+        async with self._async_session() as graph:
+            tasks = [
+                asyncio.ensure_future(run(graph, ticker, trade_date))
+                for ticker, trade_date in pairs
+            ]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    yield await next_done
+            finally:
+                for task in tasks:
+                    task.cancel()
+                # let cancelled runs unwind before the checkpointer is closed
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _state_log_entry(self, final_state):
+        """Select the parts of a final state that are written to the state log."""
+        return {
             "company_of_interest": final_state["company_of_interest"],
             "trade_date": final_state["trade_date"],
             "market_report": final_state["market_report"],
@@ -221,34 +639,52 @@ class TradingAgentsGraph:
             "final_trade_decision": final_state["final_trade_decision"],
         }
 
-        # Save to file
-        directory = Path(f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/")
-        directory.mkdir(parents=True, exist_ok=True)
+    def _log_state(self, trade_date, final_state):
+        """Append the final state to the ticker's state log."""
+        self.state_logger.log(
+            self.ticker, trade_date, self._state_log_entry(final_state)
+        )
 
-        with open(
-            f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json",
-            "w",
-        ) as f:
-            json.dump(self.log_states_dict, f, indent=4)
+    def load_states(self, ticker, start_date=None, end_date=None):
+        """Load logged final states of a ticker, keyed by trade date.
+
+        Args:
+            ticker: Company whose state log is read
+            start_date: First trade date to include (yyyy-mm-dd), None for all
+            end_date: Last trade date to include (yyyy-mm-dd), None for all
+        """
+        return self.state_logger.read(ticker, start_date, end_date)
+
+    def _reflection_memories(self):
+        """Memories updated by reflection, keyed by component name."""
+        return {
+            "bull": self.bull_memory,
+            "bear": self.bear_memory,
+            "trader": self.trader_memory,
+            "invest_judge": self.invest_judge_memory,
+            "risk_manager": self.risk_manager_memory,
+        }
 
     def reflect_and_remember(self, returns_losses):
-        """Reflect on decisions and update memory based on returns."""
-        self.reflector.reflect_bull_researcher(
-            self.curr_state, returns_losses, self.bull_memory
-        )
-        self.reflector.reflect_bear_researcher(
-            self.curr_state, returns_losses, self.bear_memory
-        )
-        self.reflector.reflect_trader(
-            self.curr_state, returns_losses, self.trader_memory
-        )
-        self.reflector.reflect_invest_judge(
-            self.curr_state, returns_losses, self.invest_judge_memory
+        """Reflect on decisions and update memory based on returns.
+
+        The five component reflections are issued concurrently, so this takes
+        about as long as a single LLM call.
+        """
+        self.reflector.reflect_all(
+            self.curr_state, returns_losses, self._reflection_memories()
         )
-        self.reflector.reflect_risk_manager(
-            self.curr_state, returns_losses, self.risk_manager_memory
+
+    def reflect_and_remember_many(self, outcomes, max_concurrency=None):
+        """Reflect on several runs at once, e.g. a portfolio at the end of the day.
+
+        outcomes: list of (final_state, returns_losses) pairs, such as the
+        final states yielded by propagate_many with their realised returns.
+        """
+        self.reflector.reflect_many(
+            outcomes, self._reflection_memories(), max_concurrency
         )
 
-    def process_signal(self, full_signal):
+    def process_signal(self, full_signal, trade_instruction=None):
         """Process a signal to extract the core decision."""
-        return self.signal_processor.process_signal(full_signal)
+        return self.signal_processor.process_signal(full_signal, trade_instruction)